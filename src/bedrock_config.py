@@ -3,15 +3,69 @@ Centralized Bedrock Configuration for All Report Generators
 Provides standardized settings for AWS Bedrock model access
 """
 
+from __future__ import annotations
+
 import os
-import boto3
-import botocore.config
 import logging
-from typing import Dict
+import threading
+from functools import lru_cache
+from typing import Dict, TYPE_CHECKING
+
+# boto3/botocore are imported on first client/config creation, not at import time
+if TYPE_CHECKING:
+    import boto3
+    import botocore.config
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _cached_boto_config() -> botocore.config.Config:
+    """Build (once per process) the botocore config used for Bedrock clients; it is the same for every report type"""
+    import botocore.config
+    # Explicitly configure no read/connect timeouts
+    return botocore.config.Config(
+        read_timeout=None,
+        connect_timeout=None,
+        # Room for the technical report's six concurrent section streams plus the other
+        # reports sharing the cached client, with kept-alive connections between calls;
+        # adaptive retries absorb the throttling that parallel requests can trigger
+        max_pool_connections=16,
+        tcp_keepalive=True,
+        retries={'max_attempts': 5, 'mode': 'adaptive'}
+    )
+
+
+# Region -> Bedrock runtime client, filled under _CLIENT_LOCK
+_BEDROCK_CLIENTS: Dict[str, object] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _cached_bedrock_client(region: str):
+    """Create (once per region) a Bedrock runtime client; boto3 clients are thread-safe once
+    built, so all report types in a process share one client and its connection pool.
+
+    Creation is not: it runs under a lock, from a dedicated Session rather than boto3's shared
+    default one, so concurrent first callers neither race in botocore's credential/loader
+    setup nor build duplicate clients.
+    """
+    client = _BEDROCK_CLIENTS.get(region)
+    if client is not None:
+        return client
+    with _CLIENT_LOCK:
+        client = _BEDROCK_CLIENTS.get(region)
+        if client is None:
+            import boto3.session
+            client = boto3.session.Session().client(
+                'bedrock-runtime',
+                region_name=region,
+                config=_cached_boto_config()
+            )
+            _BEDROCK_CLIENTS[region] = client
+            logger.info(f"✅ Created Bedrock client in {region}")
+    return client
+
+
 class BedrockConfig:
     """Centralized Bedrock configuration for all report types"""
     
@@ -27,6 +81,13 @@ class BedrockConfig:
         "eu-west-2": "arn:aws:bedrock:eu-west-2:781364298443:inference-profile/eu.anthropic.claude-sonnet-4-5-20250929-v1:0",
     }
     
+    # Regional inference profile ARNs for the faster, cheaper model used on routine sections
+    FAST_INFERENCE_PROFILES = {
+        "us-east-1": "arn:aws:bedrock:us-east-1:781364298443:inference-profile/us.anthropic.claude-haiku-4-5-20251001-v1:0",
+        "eu-west-1": "arn:aws:bedrock:eu-west-1:781364298443:inference-profile/eu.anthropic.claude-haiku-4-5-20251001-v1:0",
+        "eu-west-2": "arn:aws:bedrock:eu-west-2:781364298443:inference-profile/eu.anthropic.claude-haiku-4-5-20251001-v1:0",
+    }
+    
     # Default regions by report type
     DEFAULT_REGIONS = {
         "executive": "eu-west-2",
@@ -66,6 +127,15 @@ class BedrockConfig:
         """
         region = region or "us-east-1"
         return BedrockConfig.INFERENCE_PROFILES.get(region, BedrockConfig.INFERENCE_PROFILES["us-east-1"])
+
+    @staticmethod
+    def get_fast_inference_profile_arn(region: str = None) -> str:
+        """
+        Return the regional inference profile ARN of the fast model (Claude Haiku).
+        Defaults to us-east-1 if region not provided/known.
+        """
+        region = region or "us-east-1"
+        return BedrockConfig.FAST_INFERENCE_PROFILES.get(region, BedrockConfig.FAST_INFERENCE_PROFILES["us-east-1"])
     
     @staticmethod
     def get_boto_config(report_type: str = "executive") -> botocore.config.Config:
@@ -76,20 +146,18 @@ class BedrockConfig:
             report_type: Type of report (executive, technical, compliance)
             
         Returns:
-            Configured botocore.config.Config object
-        """
-        # Explicitly configure no read/connect timeouts
-        return botocore.config.Config(
-            read_timeout=None,
-            connect_timeout=None,
-            retries={'max_attempts': 2, 'mode': 'adaptive'}
-        )
+            Configured botocore.config.Config object (one shared instance)
+        """
+        return _cached_boto_config()
     
     @staticmethod
     def create_bedrock_client(region: str = None, report_type: str = "executive") -> boto3.client:
         """
         Create a configured Bedrock runtime client
         
+        Clients are cached per region, so repeated generator construction and
+        concurrent report types in the same process reuse one client and its connection pool.
+        
         Args:
             region: AWS region (defaults to us-east-1)
             report_type: Type of report for appropriate timeout configuration
@@ -98,18 +166,7 @@ class BedrockConfig:
             Configured boto3 bedrock-runtime client
         """
         region = region or BedrockConfig.DEFAULT_REGIONS.get(report_type, "us-east-1")
-        boto_config = BedrockConfig.get_boto_config(report_type)
-        
-        client = boto3.client(
-            'bedrock-runtime',
-            region_name=region,
-            config=boto_config
-        )
-        
-        logger.info(f"✅ Created Bedrock client for {report_type} in {region}")
-        # No timeout configured
-        
-        return client
+        return _cached_bedrock_client(region)
     
     @staticmethod
     def get_token_limit(report_type: str = "executive") -> int:
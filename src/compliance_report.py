@@ -5,20 +5,22 @@ Generates specialized compliance assessment reports for regulated industries
 Companion tool to the Executive Report Generator
 """
 
-import json
 import logging
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 from typing import Dict, Any
-import re
+
+# Shared JSON codec (orjson when installed, stdlib json otherwise)
+from src.json_codec import json_loads, json_dumps, json_dumps_indented
+from src.report_utils import PATH_STRIP_CHARS, is_subsection
 
 from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table
 from reportlab.lib.units import inch
-from reportlab.lib import colors
 
 # Import shared styling components
-from src.report_styles import EnhancedNumberedCanvas, create_enhanced_styles
+from src.report_styles import EnhancedNumberedCanvas, create_enhanced_styles, create_title_table_style
 
 # Import centralized Bedrock configuration
 from src.bedrock_config import BedrockConfig
@@ -27,6 +29,26 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(filename)s - %(l
 logger = logging.getLogger(__name__)
 
 
+class _FilenameCharTable(dict):
+    """str.translate table mapping non-word characters (other than '-') to '_', filled on first use"""
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        safe = char if char.isalnum() or char in '-_' else '_'
+        self[codepoint] = safe
+        return safe
+
+
+_FILENAME_CHARS = _FilenameCharTable()
+
+# Industry substring -> primary regulations for fallback content, checked in order
+_REGULATION_TABLE = (
+    ('financial', "SOX, PCI-DSS, GLBA, and GDPR"),
+    ('fintech', "SOX, PCI-DSS, GLBA, and GDPR"),
+    ('healthcare', "HIPAA, HITECH, and GDPR"),
+)
+
+
 class ComplianceReportGenerator:
     """Generate compliance-focused assessment reports"""
 
@@ -63,8 +85,7 @@ class ComplianceReportGenerator:
 
     def load_assessment_data(self, json_file_path: str) -> Dict[str, Any]:
         """Load assessment data from JSON"""
-        with open(json_file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
+        return json_loads(Path(json_file_path).read_bytes())
 
     def process_assessment_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process assessment data"""
@@ -111,7 +132,7 @@ class ComplianceReportGenerator:
 
 COMPANY: {company_name}
 INDUSTRY: {industry}
-ASSESSMENT DATA: {json.dumps(processed_data, indent=2)}
+ASSESSMENT DATA: {json_dumps_indented(processed_data)}
 
 Generate a comprehensive compliance and security report with 4 sections for 10-15 page PDF.
 
@@ -197,7 +218,7 @@ Return ONLY JSON with 4 sections. No markdown."""
                 # Stream tokens as they arrive
                 stream = self.bedrock_runtime.invoke_model_with_response_stream(
                     modelId=self.model_id,
-                    body=json.dumps(body)
+                    body=json_dumps(body)
                 )
 
                 assembled = []
@@ -207,7 +228,7 @@ Return ONLY JSON with 4 sections. No markdown."""
                     if not chunk:
                         continue
                     try:
-                        payload = json.loads(chunk.get("bytes").decode("utf-8"))
+                        payload = json_loads(chunk.get("bytes"))
                     except Exception:
                         payload = {"type": "text", "text": chunk.get("bytes").decode("utf-8", errors="ignore")}
 
@@ -227,11 +248,11 @@ Return ONLY JSON with 4 sections. No markdown."""
                             logger.info(f"📝 Stream fragment: {preview}")
 
                 content_text = "".join(assembled)
-                content_text = re.sub(r'```json\n?', '', content_text)
-                content_text = re.sub(r'```\n?', '', content_text)
-                content_text = content_text.strip()
+                # Fences only ever wrap the payload, so check the ends instead of scanning the body
+                content_text = content_text.strip().removeprefix('```json').removeprefix('```')
+                content_text = content_text.removesuffix('```').strip()
 
-                content = json.loads(content_text)
+                content = json_loads(content_text)
                 logger.info("✅ Compliance content generated via streaming")
                 return content
                 
@@ -249,12 +270,9 @@ Return ONLY JSON with 4 sections. No markdown."""
         industry = processed_data.get('industry', 'Technology')
         
         # Determine regulations
-        if 'financial' in industry.lower() or 'fintech' in industry.lower():
-            primary_regs = "SOX, PCI-DSS, GLBA, and GDPR"
-        elif 'healthcare' in industry.lower():
-            primary_regs = "HIPAA, HITECH, and GDPR"
-        else:
-            primary_regs = "GDPR and ISO 27001"
+        industry_lower = industry.lower()
+        primary_regs = next((regs for needle, regs in _REGULATION_TABLE if needle in industry_lower),
+                            "GDPR and ISO 27001")
         
         return {
             'compliance_gap_analysis': f"""COMPLIANCE GAP ANALYSIS
@@ -621,16 +639,7 @@ Return ONLY JSON with 4 sections. No markdown."""
         ]
         
         details_table = Table(details_data, colWidths=[2.2*inch, 2.8*inch])
-        details_table.setStyle(TableStyle([
-            ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 11),
-            ('FONT', (1, 0), (1, -1), 'Helvetica', 11),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2c5282')),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.HexColor('#F8FAFB')]),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('LINEBELOW', (0, 0), (-1, -1), 0.5, colors.HexColor('#E0E0E0')),
-        ]))
+        details_table.setStyle(create_title_table_style())
         elements.append(details_table)
         
         elements.append(Spacer(1, 0.6 * inch))
@@ -695,11 +704,7 @@ Return ONLY JSON with 4 sections. No markdown."""
                     continue
                 
                 # Check if it's a subsection header
-                is_subsection = para.endswith(':') or (
-                    len(para.split()) <= 8 and para[0].isupper() and len(para) < 80
-                )
-                
-                if is_subsection:
+                if is_subsection(para):
                     # Subsection heading
                     subsection = Paragraph(para, styles['SectionHeading'])
                     elements.append(subsection)
@@ -732,10 +737,6 @@ Return ONLY JSON with 4 sections. No markdown."""
         )
         
         styles = create_enhanced_styles()
-        elements = []
-        
-        # Title page
-        elements.extend(self.create_title_page(styles, customer_info))
         
         # Content sections
         sections = [
@@ -745,8 +746,12 @@ Return ONLY JSON with 4 sections. No markdown."""
             ("Regulatory Roadmap", content.get('regulatory_roadmap', ''))
         ]
         
-        for title, text in sections:
-            elements.extend(self.create_content_section(title, text, styles))
+        # Assemble the story in a single pass: title page followed by each section's flowables
+        section_flowables = (self.create_content_section(title, text, styles) for title, text in sections)
+        elements = list(chain(
+            self.create_title_page(styles, customer_info),
+            chain.from_iterable(section_flowables)
+        ))
         
         # Build PDF with EnhancedNumberedCanvas
         def make_canvas(*args, **kwargs):
@@ -765,7 +770,7 @@ Return ONLY JSON with 4 sections. No markdown."""
             logger.info("🚀 Starting compliance report generation...")
             
             if not json_file_path:
-                json_file_path = input("\n📄 Enter JSON assessment file path: ").strip().strip("\"'")
+                json_file_path = input("\n📄 Enter JSON assessment file path: ").strip(PATH_STRIP_CHARS)
             
             raw_data = self.load_assessment_data(json_file_path)
             processed_data = self.process_assessment_data(raw_data)
@@ -780,7 +785,7 @@ Return ONLY JSON with 4 sections. No markdown."""
             
             logger.info(f"✅ Compliance report applicable for {processed_data['industry']}")
             
-            company_name = re.sub(r'[^\w\-_]', '_', processed_data['company_name'].lower())
+            company_name = processed_data['company_name'].lower().translate(_FILENAME_CHARS)
             output_filename = f"Compliance_Security_Report_{company_name}_{self.timestamp}"
             pdf_file = self.output_dir / f"{output_filename}.pdf"
             
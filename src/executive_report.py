@@ -1,30 +1,33 @@
 #!/usr/bin/env python3
 """
 Cloud202 Executive Report Generator (Compliance-style runtime)
-- Uses centralized BedrockConfig (inference profile + invoke_model like compliance_report.py)
+- Uses centralized BedrockConfig (inference profile + invoke_model_with_response_stream like compliance_report.py)
 - Keeps the Executive prompt/sections and tone
 - Builds PDF with the same layout primitives as the compliance report
 """
 
+import io
 import json
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any
-import re
+from typing import Dict, Any, Optional
 import argparse
 
-# Centralized Bedrock configuration
-from src.bedrock_config import BedrockConfig
+# Shared JSON codec (orjson when installed, stdlib json otherwise)
+from src.json_codec import json_loads, json_dumps, json_dumps_indented
+from src.report_utils import EMPTY, SAFE_NAME_RE, infer_industry, is_subsection
 
-# ReportLab & shared styles (same as compliance)
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+# Centralized Bedrock configuration (boto3 itself is imported on first client creation)
+from src.bedrock_config import BedrockConfig
 
-# Shared canvas & styles (same as compliance)
-from src.report_styles import EnhancedNumberedCanvas, create_enhanced_styles
+# ReportLab and the shared canvas/styles (same as compliance) are imported inside the
+# PDF-building methods, so --help, batch dispatch and content-only use skip that import cost
 
 # Configure logging (consistent with other generators)
 logging.basicConfig(
@@ -33,6 +36,71 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# PDF section order: (heading, content key returned by the model)
+_SECTIONS = (
+    ("Executive Summary", "executive_summary"),
+    ("Business Case & Value Proposition", "business_case_analysis"),
+    ("Technical Implementation Roadmap", "technical_implementation_roadmap"),
+    ("Financial Investment Analysis", "financial_investment_analysis"),
+    ("Risk Mitigation Strategy", "risk_mitigation_strategy"),
+    ("Strategic Recommendations", "strategic_recommendations"),
+)
+
+
+# (needle, label) scans for the scope/timeline answers; the first needle found wins.
+# Sizes go largest band first, so text naming several bands maps to the biggest one.
+_SIZE_TABLE = (
+    ('1000+', 'Enterprise (100,000+ employees)'),
+    ('500+', 'Large Enterprise (2000-5000 employees)'),
+    ('200+', 'Mid-market (500-2000 employees)'),
+)
+_TIMELINE_TABLE = (
+    ('3-6', '3 weeks'),
+    ('6-12', '4 weeks'),
+)
+
+# Fallback section bodies, left-aligned so no source indentation leaks into the content;
+# placeholders are filled from processed data with str.format_map
+_FALLBACK_TEMPLATES = {
+    'executive_summary': """EXECUTIVE SUMMARY
+
+{company_name} in the {industry} sector is evaluating a GenAI-enabled operating model to address {business_problem}.
+This initiative focuses on measurable outcomes: cycle-time reduction, cost-per-transaction reduction, and quality uplift,
+while improving governance and risk posture. The recommended plan targets 12–15 months to initial value realization,
+with an executive cadence of monthly steering and quarterly value checkpoints.""",
+
+    'business_case_analysis': """BUSINESS CASE & VALUE PROPOSITION
+
+The program quantifies benefits across throughput, quality, and costs. Assuming a {budget} investment envelope,
+the expected ROI over three years exceeds 300%, with accelerated payback once automation scales to priority workflows.
+Unit economics improve as volume grows and defect/leakage costs decline. A KPI tree links executive metrics to
+leading indicators such as first-pass yield, backlog age, and cycle time across value streams.""",
+
+    'technical_implementation_roadmap': """TECHNICAL IMPLEMENTATION ROADMAP
+
+Delivery follows a phased roadmap: discovery & baselining (0–30 days), pilot build & data enablement (31–90 days),
+scale-out & platform hardening (91–180 days), and enterprise rollout (180–360 days). Workstreams cover data,
+model lifecycle (eval/guardrails), integration, and platform operations with a secure-by-default approach.""",
+
+    'financial_investment_analysis': """FINANCIAL INVESTMENT ANALYSIS
+
+Budget considers platform subscriptions, cloud consumption, integration, change management, and enablement.
+A sensitivity analysis reflects utilization bands and workload seasonality. Assumptions include cloud credits,
+reserved capacity, and foundation investments that amortize across use cases.""",
+
+    'risk_mitigation_strategy': """RISK MITIGATION STRATEGY
+
+Primary risks include delivery slip, data quality, change fatigue, and model risk. Controls: gated releases,
+reference environments, backtesting, policy-as-code, and a clear RACI with escalation thresholds.
+A governance cadence enforces scope integrity and value tracking.""",
+
+    'strategic_recommendations': """STRATEGIC RECOMMENDATIONS
+
+Establish an Executive Steering Committee and an AI Center of Excellence, align incentives to outcome KPIs,
+adopt a product operating model, and prioritize two lighthouse use cases for rapid proof of value.
+Codify learnings into standards, templates, and enablement to accelerate the portfolio.""",
+}
+
 
 class Cloud202ExecutiveReportGenerator:
     """
@@ -42,7 +110,11 @@ class Cloud202ExecutiveReportGenerator:
     def __init__(self, aws_region: str = None):
         # Use region from centralized config (mirrors compliance)
         self.aws_region = aws_region or BedrockConfig.get_region("executive")
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # One clock read per generator: file timestamp plus the dates shown in the report
+        now = datetime.now()
+        self.timestamp = now.strftime("%Y%m%d_%H%M%S")
+        self.report_date_iso = now.strftime('%Y-%m-%d')
+        self.report_date_long = now.strftime('%B %d, %Y')
 
         # Use regional inference profile ARN (mirrors compliance)
         self.model_id = BedrockConfig.get_inference_profile_arn(self.aws_region)
@@ -64,23 +136,48 @@ class Cloud202ExecutiveReportGenerator:
         # Token budget for executive reports (from BedrockConfig)
         self.max_tokens = BedrockConfig.get_token_limit("executive")
 
+        # Branding is environment-derived and fixed for the generator's lifetime
+        self.branding = BedrockConfig.get_branding()
+
         # Output & styles
         self.output_dir = Path("reports")
         self.output_dir.mkdir(exist_ok=True)
-        self.styles = create_enhanced_styles()
+
+    @cached_property
+    def styles(self):
+        """Shared stylesheet, built on first PDF render."""
+        from src.report_styles import create_enhanced_styles
+        return create_enhanced_styles()
 
     # ---------- IO / Processing ----------
 
     def load_assessment_data(self, json_file_path: str) -> Dict[str, Any]:
         """Load customer assessment responses from JSON file."""
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = json_loads(Path(json_file_path).read_bytes())
         logger.info(f"📖 Loaded assessment data from {json_file_path}")
         return data
 
     def process_assessment_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process assessment data into a normalized dict used by prompts/PDF."""
         responses = raw_data.get('responses', {})
+        assessment_date = raw_data.get('exportDate', self.report_date_iso)[:10]
+
+        # Nothing to infer from: skip the heuristics and return their defaults directly
+        if not responses:
+            return {
+                'company_name': 'Valued Customer',
+                'industry': 'Technology',
+                'company_size': 'Enterprise',
+                'assessment_type': 'Exploratory',
+                'assessment_date': assessment_date,
+                'assessment_duration': '2 weeks',
+                'business_problem': '',
+                'budget_range': '',
+                'primary_goal': '',
+                'strategic_alignment': '',
+                'urgency': '',
+                'responses': {}
+            }
 
         # Company name heuristics (consistent with your other generators)
         business_owner = responses.get('business-owner', '')
@@ -94,7 +191,7 @@ class Cloud202ExecutiveReportGenerator:
             'industry': self._infer_industry(responses),
             'company_size': self._map_company_size(responses.get('scope-impact', '')),
             'assessment_type': responses.get('current-state', 'Exploratory'),
-            'assessment_date': raw_data.get('exportDate', datetime.now().isoformat())[:10],
+            'assessment_date': assessment_date,
             'assessment_duration': self._map_timeline(responses.get('development-timeline', '')),
             'business_problem': responses.get('business-problems', ''),
             'budget_range': responses.get('budget-range', ''),
@@ -107,38 +204,15 @@ class Cloud202ExecutiveReportGenerator:
 
     def _infer_industry(self, responses: Dict[str, Any]) -> str:
         """Infer industry from free-text answers."""
-        problem = (responses.get('business-problems', '') or '').lower()
-
-        if any(word in problem for word in ['clinical', 'physician', 'patient', 'healthcare', 'medical']):
-            return 'Healthcare Technology'
-        elif any(word in problem for word in ['financial', 'banking', 'fintech', 'payment', 'trading', 'market']):
-            return 'Financial Technology'
-        elif any(word in problem for word in ['vehicle', 'manufacturing', 'automotive']):
-            return 'Manufacturing & Automotive'
-        else:
-            return 'Technology'
+        return infer_industry(responses.get('business-problems', '') or '')
 
     def _map_company_size(self, scope: str) -> str:
         """Map scope text to size labels."""
-        s = scope or ''
-        if '200+' in s:
-            return 'Mid-market (500-2000 employees)'
-        elif '1000+' in s:
-            return 'Enterprise (100,000+ employees)'
-        elif '500+' in s:
-            return 'Large Enterprise (2000-5000 employees)'
-        else:
-            return 'Enterprise'
+        return next((label for needle, label in _SIZE_TABLE if needle in (scope or '')), 'Enterprise')
 
     def _map_timeline(self, timeline: str) -> str:
         """Map development timeline to assessment duration."""
-        t = timeline or ''
-        if '3-6' in t:
-            return '3 weeks'
-        elif '6-12' in t:
-            return '4 weeks'
-        else:
-            return '2 weeks'
+        return next((label for needle, label in _TIMELINE_TABLE if needle in (timeline or '')), '2 weeks')
 
     # ---------- Prompt ----------
 
@@ -168,7 +242,7 @@ class Cloud202ExecutiveReportGenerator:
                 URGENCY: {urgency}
 
                 ASSESSMENT DATA:
-                {json.dumps(processed_data, indent=2)}
+                {json_dumps_indented(processed_data)}
 
                 Generate a detailed executive report with 6 sections. Each section should be 800-1200 words for a comprehensive 12-15 page PDF.
 
@@ -261,25 +335,30 @@ class Cloud202ExecutiveReportGenerator:
             # Stream tokens as they arrive
             stream = self.bedrock_runtime.invoke_model_with_response_stream(
                 modelId=self.model_id,
-                body=json.dumps(body)
+                body=json_dumps(body)
             )
 
-            assembled = []
+            # Accumulate deltas in one growing buffer rather than a list joined at the end
+            assembled = io.StringIO()
+            fragments = 0
+            info_previews = logger.isEnabledFor(logging.INFO)
             event_stream = stream.get("body")
             for event in event_stream:
                 chunk = event.get("chunk")
                 if not chunk:
                     continue
+                raw = chunk.get("bytes")
                 try:
-                    payload = json.loads(chunk.get("bytes").decode("utf-8"))
+                    # Parse the raw event bytes directly; no intermediate decoded str
+                    payload = json_loads(raw)
                 except Exception:
                     # Fallback to raw decode if not JSON
-                    payload = {"type": "text", "text": chunk.get("bytes").decode("utf-8", errors="ignore")}
+                    payload = {"type": "text", "text": raw.decode("utf-8", errors="ignore")}
 
                 if isinstance(payload, dict):
-                    # Bedrock text delta variants
+                    # Bedrock text delta variants; content_block_delta text short-circuits first
                     text_piece = (
-                        payload.get("delta", {}).get("text")
+                        (payload.get("delta") or EMPTY).get("text")
                         or payload.get("text")
                         or ""
                     )
@@ -287,13 +366,13 @@ class Cloud202ExecutiveReportGenerator:
                     text_piece = ""
 
                 if text_piece:
-                    assembled.append(text_piece)
-                    # Lightweight preview log without overwhelming output
-                    if len(assembled) % 20 == 0:
-                        preview = text_piece.replace('\n', ' ')[:120]
-                        logger.info(f"📝 Stream fragment: {preview}")
+                    assembled.write(text_piece)
+                    fragments += 1
+                    # Lightweight preview log; the slice/replace only runs when INFO is enabled
+                    if info_previews and fragments % 20 == 0:
+                        logger.info("📝 Stream fragment: %s", text_piece[:120].replace('\n', ' '))
 
-            content_text = "".join(assembled)
+            content_text = assembled.getvalue()
             content = self._parse_json_response(content_text)
             logger.info("✅ Executive content generated via streaming.")
             return content
@@ -308,64 +387,31 @@ class Cloud202ExecutiveReportGenerator:
         """Remove code fences and parse JSON safely."""
         if not text:
             raise ValueError("Empty response content from Bedrock")
-        cleaned = re.sub(r'```json\s*', '', text)
-        cleaned = re.sub(r'```\s*', '', cleaned)
-        cleaned = cleaned.strip()
-        return json.loads(cleaned)
+        # Fences only ever wrap the payload, so check the ends instead of scanning the body
+        cleaned = text.strip().removeprefix('```json').removeprefix('```')
+        cleaned = cleaned.removesuffix('```').strip()
+        return json_loads(cleaned)
 
     # ---------- Fallback Content (keep high quality) ----------
 
     def _generate_fallback_content(self, processed_data: Dict[str, Any]) -> Dict[str, str]:
         """Executive fallback content with credible defaults (business-focused)."""
-        company_name = processed_data.get('company_name', 'Customer')
-        industry = processed_data.get('industry', 'Technology')
-        business_problem = processed_data.get('business_problem', 'operational challenges')
-        budget = processed_data.get('budget_range', '$500K - $1M')
-
-        return {
-            'executive_summary': f"""EXECUTIVE SUMMARY
-
-            {company_name} in the {industry} sector is evaluating a GenAI-enabled operating model to address {business_problem}.
-            This initiative focuses on measurable outcomes: cycle-time reduction, cost-per-transaction reduction, and quality uplift,
-            while improving governance and risk posture. The recommended plan targets 12–15 months to initial value realization,
-            with an executive cadence of monthly steering and quarterly value checkpoints.""",
-
-                        'business_case_analysis': f"""BUSINESS CASE & VALUE PROPOSITION
-
-            The program quantifies benefits across throughput, quality, and costs. Assuming a {budget} investment envelope,
-            the expected ROI over three years exceeds 300%, with accelerated payback once automation scales to priority workflows.
-            Unit economics improve as volume grows and defect/leakage costs decline. A KPI tree links executive metrics to
-            leading indicators such as first-pass yield, backlog age, and cycle time across value streams.""",
-
-                        'technical_implementation_roadmap': """TECHNICAL IMPLEMENTATION ROADMAP
-
-            Delivery follows a phased roadmap: discovery & baselining (0–30 days), pilot build & data enablement (31–90 days),
-            scale-out & platform hardening (91–180 days), and enterprise rollout (180–360 days). Workstreams cover data,
-            model lifecycle (eval/guardrails), integration, and platform operations with a secure-by-default approach.""",
-
-                        'financial_investment_analysis': """FINANCIAL INVESTMENT ANALYSIS
-
-            Budget considers platform subscriptions, cloud consumption, integration, change management, and enablement.
-            A sensitivity analysis reflects utilization bands and workload seasonality. Assumptions include cloud credits,
-            reserved capacity, and foundation investments that amortize across use cases.""",
-
-                        'risk_mitigation_strategy': """RISK MITIGATION STRATEGY
-
-            Primary risks include delivery slip, data quality, change fatigue, and model risk. Controls: gated releases,
-            reference environments, backtesting, policy-as-code, and a clear RACI with escalation thresholds.
-            A governance cadence enforces scope integrity and value tracking.""",
-
-                        'strategic_recommendations': """STRATEGIC RECOMMENDATIONS
-
-            Establish an Executive Steering Committee and an AI Center of Excellence, align incentives to outcome KPIs,
-            adopt a product operating model, and prioritize two lighthouse use cases for rapid proof of value.
-            Codify learnings into standards, templates, and enablement to accelerate the portfolio."""
+        fields = {
+            'company_name': processed_data.get('company_name', 'Customer'),
+            'industry': processed_data.get('industry', 'Technology'),
+            'business_problem': processed_data.get('business_problem', 'operational challenges'),
+            'budget': processed_data.get('budget_range', '$500K - $1M'),
         }
+        return {key: template.format_map(fields) for key, template in _FALLBACK_TEMPLATES.items()}
 
     # ---------- PDF Build (same layout primitives as compliance) ----------
 
     def create_title_page(self, styles, customer_data):
         """Create executive report title page (matching compliance report sophistication)"""
+        from reportlab.platypus import Paragraph, Spacer, PageBreak, Table
+        from reportlab.lib.units import inch
+        from src.report_styles import create_title_table_style
+
         elements = []
         
         # Add space at top
@@ -388,22 +434,13 @@ class Cloud202ExecutiveReportGenerator:
         details_data = [
             ['Industry:', customer_data.get('industry', 'Technology')],
             ['Assessment Type:', 'Executive Strategic'],
-            ['Assessment Date:', customer_data.get('assessment_date', datetime.now().strftime('%Y-%m-%d'))],
+            ['Assessment Date:', customer_data.get('assessment_date', self.report_date_iso)],
             ['Duration:', customer_data.get('assessment_duration', '3 weeks')],
             ['Budget Range:', customer_data.get('budget_range', 'To be determined')]
         ]
         
         details_table = Table(details_data, colWidths=[2.2*inch, 2.8*inch])
-        details_table.setStyle(TableStyle([
-            ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 11),
-            ('FONT', (1, 0), (1, -1), 'Helvetica', 11),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2c5282')),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.HexColor('#F8FAFB')]),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('LINEBELOW', (0, 0), (-1, -1), 0.5, colors.HexColor('#E0E0E0')),
-        ]))
+        details_table.setStyle(create_title_table_style())
         elements.append(details_table)
         
         elements.append(Spacer(1, 0.6 * inch))
@@ -418,7 +455,7 @@ class Cloud202ExecutiveReportGenerator:
         elements.append(Spacer(1, 0.3 * inch))
         
         # Prepared by section
-        branding = BedrockConfig.get_branding()
+        branding = self.branding
         prep_by_label = Paragraph("<b>Prepared by:</b>", styles['SectionHeading'])
         elements.append(prep_by_label)
         elements.append(Spacer(1, 0.08 * inch))
@@ -436,7 +473,7 @@ class Cloud202ExecutiveReportGenerator:
         
         # Report date
         date_para = Paragraph(
-            f"Report Generated: {datetime.now().strftime('%B %d, %Y')}",
+            f"Report Generated: {self.report_date_long}",
             styles['BodyTextEnhanced']
         )
         elements.append(date_para)
@@ -447,55 +484,57 @@ class Cloud202ExecutiveReportGenerator:
 
     def create_content_section(self, title: str, content: str, styles):
         """Create content section (matching compliance report intelligence)"""
-        elements = []
-        
+        from reportlab.platypus import Paragraph, Spacer, PageBreak
+        from reportlab.lib.units import inch
+
         # Section title
-        section_title = Paragraph(title, styles['MainHeading'])
-        elements.append(section_title)
-        elements.append(Spacer(1, 0.2 * inch))
+        elements = [Paragraph(title, styles['MainHeading']), Spacer(1, 0.2 * inch)]
         
-        # Process content
+        # Process content: one extend per section instead of two appends per paragraph
         if content.strip():
-            # Split into paragraphs
-            paragraphs = content.split('\n\n')
-            
-            for para in paragraphs:
-                para = para.strip()
-                if not para:
-                    continue
-                
-                # Skip if paragraph matches section title (avoid duplicate)
-                if para == title:
-                    continue
-                
-                # Check if it's a subsection header
-                is_subsection = para.endswith(':') or (
-                    len(para.split()) <= 8 and para[0].isupper() and len(para) < 80
-                )
-                
-                if is_subsection:
-                    # Subsection heading
-                    subsection = Paragraph(para, styles['SectionHeading'])
-                    elements.append(subsection)
-                    elements.append(Spacer(1, 0.08 * inch))
-                else:
-                    # Regular paragraph
-                    paragraph = Paragraph(para, styles['BodyTextEnhanced'])
-                    elements.append(paragraph)
-                    elements.append(Spacer(1, 0.1 * inch))
+            elements.extend(self._paragraph_flowables(title, content, styles))
         
         # Always end with page break for dedicated pages
-        if elements and len(elements) > 2:
+        if len(elements) > 2:
             elements.append(PageBreak())
         
         return elements
 
-    def build_pdf(self, content: Dict[str, str], output_path: Path) -> None:
+    @staticmethod
+    def _paragraph_flowables(title: str, content: str, styles):
+        """Yield (Paragraph, Spacer) flowables for each paragraph of a section body."""
+        from reportlab.platypus import Paragraph, Spacer
+        from reportlab.lib.units import inch
+
+        heading_style = styles['SectionHeading']
+        body_style = styles['BodyTextEnhanced']
+        # Spacers are created per paragraph: platypus marks flowables during layout,
+        # so a single shared instance is not safe to place more than once
+        for para in content.split('\n\n'):
+            para = para.strip()
+            # Skip blanks and paragraphs matching the section title (avoid duplicate)
+            if not para or para == title:
+                continue
+            
+            # Check if it's a subsection header
+            if is_subsection(para):
+                yield Paragraph(para, heading_style)
+                yield Spacer(1, 0.08 * inch)
+            else:
+                yield Paragraph(para, body_style)
+                yield Spacer(1, 0.1 * inch)
+
+    def build_pdf(self, content: Dict[str, str], output_path: Path, processed_data: Dict[str, Any]) -> None:
         """Render the Executive report content into a styled PDF (matching compliance sophistication)."""
-        processed_data = self.process_assessment_data({'responses': {}}) if not hasattr(self, '_current_processed_data') else self._current_processed_data
-        
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate
+        from reportlab.lib.units import inch
+        from src.report_styles import EnhancedNumberedCanvas
+
+        # Convert the path once via the fspath protocol; reused for the document and the log
+        output_str = os.fspath(output_path)
         doc = SimpleDocTemplate(
-            str(output_path),
+            output_str,
             pagesize=A4,
             rightMargin=0.7 * inch,
             leftMargin=0.7 * inch,
@@ -505,28 +544,22 @@ class Cloud202ExecutiveReportGenerator:
             author="Cloud202 Executive Team"
         )
         
-        styles = create_enhanced_styles()
-        elements = []
-        
-        # Sophisticated title page
-        elements.extend(self.create_title_page(styles, processed_data))
+        # Reuse the stylesheet built in __init__
+        styles = self.styles
         
-        # Content sections using sophisticated formatting
-        sections = [
-            ("Executive Summary", content.get('executive_summary', '')),
-            ("Business Case & Value Proposition", content.get('business_case_analysis', '')),
-            ("Technical Implementation Roadmap", content.get('technical_implementation_roadmap', '')),
-            ("Financial Investment Analysis", content.get('financial_investment_analysis', '')),
-            ("Risk Mitigation Strategy", content.get('risk_mitigation_strategy', '')),
-            ("Strategic Recommendations", content.get('strategic_recommendations', ''))
-        ]
-        
-        for title, text in sections:
-            elements.extend(self.create_content_section(title, text, styles))
+        # Assemble the story in a single pass: title page followed by each section's flowables
+        section_flowables = (
+            self.create_content_section(title, content.get(key, ''), styles) for title, key in _SECTIONS
+        )
+        elements = list(chain(
+            self.create_title_page(styles, processed_data),
+            chain.from_iterable(section_flowables)
+        ))
         
         # Build PDF with EnhancedNumberedCanvas
+        branding = self.branding
+
         def make_canvas(*args, **kwargs):
-            branding = BedrockConfig.get_branding()
             return EnhancedNumberedCanvas(
                 *args,
                 company_name=processed_data.get('company_name', branding.get('company_name', 'Cloud202')),
@@ -535,7 +568,7 @@ class Cloud202ExecutiveReportGenerator:
             )
         
         doc.build(elements, canvasmaker=make_canvas)
-        logger.info(f"📄 PDF written: {output_path}")
+        logger.info(f"📄 PDF written: {output_str}")
 
     # ---------- Orchestration ----------
 
@@ -545,15 +578,12 @@ class Cloud202ExecutiveReportGenerator:
         processed = self.process_assessment_data(raw)
         content = self.generate_report_content(processed)
 
-        # Store processed data for PDF generation
-        self._current_processed_data = processed
-
-        safe_company = re.sub(r'[^A-Za-z0-9_-]+', '_', processed.get('company_name', 'Customer')).strip('_')
+        safe_company = SAFE_NAME_RE.sub('_', processed.get('company_name', 'Customer')).strip('_')
         pdf_path = self.output_dir / f"Executive_Report_{safe_company}_{self.timestamp}.pdf"
-        self.build_pdf(content, pdf_path)
+        self.build_pdf(content, pdf_path, processed)
 
         return {
-            "pdf_path": str(pdf_path),
+            "pdf_path": os.fspath(pdf_path),
             "content": content,
             "meta": processed
         }
@@ -561,12 +591,48 @@ class Cloud202ExecutiveReportGenerator:
 
 # ---------- CLI ----------
 
+def _generate_one(json_path: str, region: Optional[str]) -> Dict[str, Any]:
+    """Batch worker: build the generator (and so its Bedrock client) inside the worker process."""
+    result = Cloud202ExecutiveReportGenerator(aws_region=region).generate_report(json_path)
+    return {
+        "ok": True,
+        "input": json_path,
+        "pdf_path": result["pdf_path"],
+        "meta": result["meta"]
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate Executive Report (compliance-style runtime).")
-    parser.add_argument("input_json", help="Path to assessment JSON export")
+    parser.add_argument("input_json", nargs="?", help="Path to assessment JSON export")
     parser.add_argument("--region", help="AWS region (overrides BedrockConfig default for executive)", default=None)
+    parser.add_argument("--batch", metavar="DIR", help="Render every *.json export in DIR concurrently", default=None)
+    parser.add_argument("--workers", type=int, help="Worker processes for --batch (default: CPU count)", default=None)
     args = parser.parse_args()
 
+    if bool(args.input_json) == bool(args.batch):
+        parser.error("provide either input_json or --batch DIR")
+
+    if args.batch:
+        json_paths = sorted(str(p) for p in Path(args.batch).glob("*.json"))
+        if not json_paths:
+            parser.error(f"--batch: no *.json files found in {args.batch}")
+        results = []
+        # Separate processes: ReportLab layout is CPU-bound and rarely releases the GIL.
+        # Spawned, not forked, so workers never inherit the parent's boto3/urllib3 state.
+        with ProcessPoolExecutor(max_workers=args.workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = {pool.submit(_generate_one, path, args.region): path for path in json_paths}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"❌ Executive report failed for {path}: {e}")
+                    results.append({"ok": False, "input": path, "error": str(e)})
+        print(json.dumps(results, indent=2))
+        return
+
     gen = Cloud202ExecutiveReportGenerator(aws_region=args.region)
     result = gen.generate_report(args.input_json)
 
@@ -0,0 +1,28 @@
+"""
+Shared JSON codec for the report generators
+Uses orjson when it is installed and falls back to the stdlib json module otherwise
+"""
+
+import json
+from typing import Any
+
+__all__ = ['json_loads', 'json_dumps', 'json_dumps_indented']
+
+# json_loads accepts str or bytes with either backend. json_dumps returns bytes with orjson
+# and str with json; Bedrock accepts either as a request body.
+try:
+    import orjson
+
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+
+    def json_dumps_indented(obj: Any) -> str:
+        """Serialize obj as 2-space indented JSON text."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+
+    def json_dumps_indented(obj: Any) -> str:
+        """Serialize obj as 2-space indented JSON text."""
+        return json.dumps(obj, indent=2)
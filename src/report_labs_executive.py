@@ -1,15 +1,14 @@
 import os
-import sys
+import stat
 import argparse
+import importlib
 import logging
-from pathlib import Path
-from typing import Dict, Any
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, Any, Optional
 
-# Ensure project root is on sys.path so `src.*` imports work when running this file directly
-_CURRENT_FILE = Path(__file__).resolve()
-_PROJECT_ROOT = _CURRENT_FILE.parent.parent
-if str(_PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(_PROJECT_ROOT))
+from src.report_utils import PATH_STRIP_CHARS
 
 # Configure logging
 logging.basicConfig(
@@ -18,41 +17,133 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-
-def generate_all_reports(json_file_path: str, force_compliance: bool = True) -> Dict[str, Dict[str, Any]]:
+# Report type -> (module, generator class), imported on first use rather than at CLI start-up
+_GENERATORS = {
+    "executive": ("src.executive_report", "Cloud202ExecutiveReportGenerator"),
+    "technical": ("src.technical_report", "Cloud202TechnicalDeepDiveGenerator"),
+    "compliance": ("src.compliance_report", "ComplianceReportGenerator"),
+}
+
+
+@lru_cache(maxsize=None)
+def _generator_class(rtype: str) -> type:
+    """Import and resolve a generator class once per process (import errors are not cached)."""
+    module_name, class_name = _GENERATORS[rtype]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _generate_one(rtype: str, json_file_path: str, force_compliance: bool) -> Dict[str, Any]:
+    """Build a single report type; module-level so it can run in a worker process."""
+    generator = _generator_class(rtype)()
+    if rtype == "compliance":
+        # Compliance (forced if configured)
+        return generator.generate_report(json_file_path, force=force_compliance)
+    return generator.generate_report(json_file_path)
+
+
+def _generate_serially(results: Dict[str, Any], json_file_path: str, force_compliance: bool) -> None:
+    """Build each report in turn in this process, filling ``results`` in place."""
+    for rtype in results:
+        try:
+            results[rtype] = _generate_one(rtype, json_file_path, force_compliance)
+        except Exception as e:
+            logger.error(f"{rtype.title()} report failed: {e}")
+
+
+def _generate_in_pool(pool: Executor, results: Dict[str, Any], json_file_path: str,
+                      force_compliance: bool) -> None:
+    """Build every report type concurrently on ``pool``, filling ``results`` in place."""
+    futures = {
+        pool.submit(_generate_one, rtype, json_file_path, force_compliance): rtype
+        for rtype in results
+    }
+    for future in as_completed(futures):
+        rtype = futures[future]
+        try:
+            results[rtype] = future.result()
+        except Exception as e:
+            logger.error(f"{rtype.title()} report failed: {e}")
+
+
+def generate_all_reports(json_file_path: str, force_compliance: bool = True,
+                         parallel: bool = True) -> Dict[str, Dict[str, Any]]:
     """Generate Executive, Technical, and Compliance reports together.
 
+    By default the three builds run concurrently in separate worker processes, so ReportLab
+    layout and the Bedrock calls overlap and each process gets its own boto3 client.
+    Workers are spawned, so a script calling this must guard its entry point with
+    ``if __name__ == "__main__":`` (as the CLIs here do).
+    Where worker processes are unavailable (e.g. AWS Lambda, which has no /dev/shm), the
+    builds run on threads instead: they mostly wait on Bedrock, and the per-region boto3
+    client they share is created once under a lock and thread-safe to use.
+    Pass ``parallel=False`` to build them one after another in this process (easier to debug).
     Returns a dict mapping report types to their result dicts. Any report that fails returns None.
     """
     results: Dict[str, Any] = {"executive": None, "technical": None, "compliance": None}
 
-    # Executive
-    try:
-        from src.executive_report import Cloud202ExecutiveReportGenerator
-        exec_gen = Cloud202ExecutiveReportGenerator()
-        results["executive"] = exec_gen.generate_report(json_file_path)
-    except Exception as e:
-        logger.error(f"Executive report failed: {e}")
+    if not parallel:
+        _generate_serially(results, json_file_path, force_compliance)
+        return results
 
-    # Technical
     try:
-        from src.technical_report import Cloud202TechnicalDeepDiveGenerator
-        tech_gen = Cloud202TechnicalDeepDiveGenerator()
-        results["technical"] = tech_gen.generate_report(json_file_path)
-    except Exception as e:
-        logger.error(f"Technical report failed: {e}")
-
-    # Compliance (forced if configured)
-    try:
-        from src.compliance_report import ComplianceReportGenerator
-        comp_gen = ComplianceReportGenerator()
-        results["compliance"] = comp_gen.generate_report(json_file_path, force=force_compliance)
-    except Exception as e:
-        logger.error(f"Compliance report failed: {e}")
+        # "spawn" rather than the Linux default fork: a forked worker would inherit any cached
+        # boto3 client (and its keep-alive sockets) the caller already built, which is not
+        # fork-safe. Each spawned worker imports its generator and creates its own client.
+        with ProcessPoolExecutor(max_workers=len(results),
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            _generate_in_pool(pool, results, json_file_path, force_compliance)
+    except (OSError, NotImplementedError) as e:
+        # No process support here (e.g. no /dev/shm); overlap the builds on threads instead
+        logger.warning(f"Process pool unavailable ({e}); generating reports on threads")
+        with ThreadPoolExecutor(max_workers=len(results)) as pool:
+            _generate_in_pool(pool, results, json_file_path, force_compliance)
 
     return results
 
 
+def _interactive_pick_json() -> Optional[str]:
+    """List JSON files in the current directory and prompt for one.
+
+    Returns the chosen path, or None if the user picks "Exit".
+    """
+    # Single directory pass; DirEntry caches its stat result for the size listing below
+    with os.scandir(".") as entries:
+        json_files = [entry for entry in entries if entry.name.endswith(".json") and entry.is_file()]
+    # Keep the bundled sample assessment at the top of the list
+    json_files.sort(key=lambda entry: entry.name != "test_json_comprehensive.json")
+
+    if not json_files:
+        return input("\n📄 Enter JSON file path: ").strip(PATH_STRIP_CHARS)
+
+    print(f"\n📂 Found {len(json_files)} JSON file(s):")
+    for i, file in enumerate(json_files, 1):
+        try:
+            size_kb = (file.stat().st_size / 1024)
+            size_str = f"{size_kb:.1f} KB"
+        except Exception:
+            size_str = "unknown size"
+        print(f"   {i}. {file.name} ({size_str})")
+
+    print(f"\n   {len(json_files) + 1}. Enter custom file path")
+    print("   0. Exit")
+
+    while True:
+        try:
+            choice = input(f"\nSelect option (0-{len(json_files) + 1}): ").strip()
+            if choice == "0":
+                return None
+            elif choice == str(len(json_files) + 1):
+                return input("\n📄 Enter JSON file path: ").strip(PATH_STRIP_CHARS)
+            elif 1 <= int(choice) <= len(json_files):
+                json_file = json_files[int(choice) - 1].name
+                print(f"✅ Selected: {json_file}")
+                return json_file
+            else:
+                print("❌ Invalid selection.")
+        except (ValueError, IndexError):
+            print("❌ Invalid input.")
+
+
 def main():
     """CLI Orchestrator for generating all three reports"""
     print("\n" + "="*60)
@@ -63,48 +154,24 @@ def main():
     parser.add_argument("--json", dest="json_path", help="Path to assessment JSON file", default=None)
     args = parser.parse_args()
 
-    # If a JSON path is provided via CLI, use it directly; otherwise, pick from current directory
+    # If a JSON path is provided via CLI, use it directly (no directory scan);
+    # otherwise, pick interactively from the current directory
     if args.json_path:
-        json_file = args.json_path.strip().strip("\"'")
+        json_file = args.json_path.strip(PATH_STRIP_CHARS)
     else:
-        json_files = list(Path(".").glob("*.json"))
-        if Path("test_json_comprehensive.json").exists():
-            json_files = [Path("test_json_comprehensive.json")] + [p for p in json_files if p.name != "test_json_comprehensive.json"]
-
-    if args.json_path is None and json_files:
-        print(f"\n📂 Found {len(json_files)} JSON file(s):")
-        for i, file in enumerate(json_files, 1):
-            try:
-                size_kb = (file.stat().st_size / 1024)
-                size_str = f"{size_kb:.1f} KB"
-            except Exception:
-                size_str = "unknown size"
-            print(f"   {i}. {file.name} ({size_str})")
-
-        print(f"\n   {len(json_files) + 1}. Enter custom file path")
-        print("   0. Exit")
-
-        while True:
-            try:
-                choice = input(f"\nSelect option (0-{len(json_files) + 1}): ").strip()
-                if choice == "0":
-                    print("👋 Exiting...")
-                    return 0
-                elif choice == str(len(json_files) + 1):
-                    json_file = input("\n📄 Enter JSON file path: ").strip().strip("\"'")
-                    break
-                elif 1 <= int(choice) <= len(json_files):
-                    json_file = str(json_files[int(choice) - 1])
-                    print(f"✅ Selected: {json_file}")
-                    break
-                else:
-                    print("❌ Invalid selection.")
-            except (ValueError, IndexError):
-                print("❌ Invalid input.")
-    elif args.json_path is None:
-        json_file = input("\n📄 Enter JSON file path: ").strip().strip("\"'")
-
-    if not os.path.exists(json_file):
+        json_file = _interactive_pick_json()
+        if json_file is None:
+            print("👋 Exiting...")
+            return 0
+
+    # Up-front check with a single stat that also rejects directories (exists() let them
+    # through); the generators open the file again later, so a file removed in between
+    # still surfaces as a per-report failure
+    try:
+        is_file = stat.S_ISREG(os.stat(json_file).st_mode)
+    except OSError:
+        is_file = False
+    if not is_file:
         print(f"❌ File not found: {json_file}")
         return 1
 
@@ -9,250 +9,313 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
 from reportlab.pdfgen import canvas
+from reportlab.platypus import TableStyle
 
-__all__ = ['NumberedCanvas', 'EnhancedNumberedCanvas', 'create_enhanced_styles']
+__all__ = ['NumberedCanvas', 'EnhancedNumberedCanvas', 'create_enhanced_styles', 'create_title_table_style']
+
+# Brand palette (parsed once at import instead of on every style build / page footer)
+_NAVY = colors.HexColor('#1a365d')
+_BLUE = colors.HexColor('#2c5282')
+_INDIGO = colors.HexColor('#425282')
+_SLATE = colors.HexColor('#2d3748')
+_BG_BLUE = colors.HexColor('#E8F0FF')
+_BG_AMBER = colors.HexColor('#fef5e7')
+_BORDER_AMBER = colors.HexColor('#f39c12')
+_FOOTER_GREY = colors.HexColor('#666666')
+_FOOTER_RULE = colors.HexColor('#E0E0E0')
+_ROW_ALT = colors.HexColor('#F8FAFB')
 
 
 class NumberedCanvas(canvas.Canvas):
     """Custom canvas for page numbers and headers/footers (legacy)"""
+
+    # Footer geometry in points, precomputed for the per-page draw
+    _CENTER_X = A4[0] / 2.0
+    _PAGE_NUM_Y = 0.5 * 0.75 * 72
+    _FOOTER_X = 0.75 * 72
+    _FOOTER_Y = 0.5 * 72
+    _LINE_Y = 0.65 * 72
+    _LINE_X2 = A4[0] - 0.75 * 72
+
     def __init__(self, *args, **kwargs):
         # Extract report_type if provided
         self.report_type = kwargs.pop('report_type', 'RAPID Assessment')
         canvas.Canvas.__init__(self, *args, **kwargs)
-        self._saved_page_states = []
+        # Footer text is fixed for the document, so format it once rather than per page
+        self._footer_text = f"Cloud202 - {self.report_type}"
+        # Page numbers whose "Page N of M" form is filled in once M is known
+        self._numbered_pages = []
 
     def showPage(self):
-        self._saved_page_states.append(dict(self.__dict__))
-        self._startPage()
+        # Single pass: draw the footer now and reference a per-page form for the
+        # page number, so no page state has to be snapshotted and replayed
+        self.draw_footer()
+        self._numbered_pages.append(self._pageNumber)
+        canvas.Canvas.showPage(self)
 
     def save(self):
-        num_pages = len(self._saved_page_states)
-        for state in self._saved_page_states:
-            self.__dict__.update(state)
-            self.draw_page_number(num_pages)
-            canvas.Canvas.showPage(self)
+        num_pages = len(self._numbered_pages)
+        for page_number in self._numbered_pages:
+            self.beginForm(self._page_number_form(page_number))
+            self.draw_page_number(page_number, num_pages)
+            self.endForm()
         canvas.Canvas.save(self)
 
-    def draw_page_number(self, page_count):
-        self.setFont("Helvetica", 9)
-        self.setFillColor(colors.grey)
-        # Page number at bottom center
-        self.drawCentredString(
-            A4[0] / 2.0,
-            0.5 * 0.75 * 72,  # 0.5 inch in points
-            f"Page {self._pageNumber} of {page_count}"
-        )
+    @staticmethod
+    def _page_number_form(page_number):
+        return f"NumberedCanvasPage{page_number}"
+
+    def draw_footer(self):
+        # Page number at bottom center (form body is drawn in save())
+        self.doForm(self._page_number_form(self._pageNumber))
         # Company footer
         self.setFont("Helvetica", 8)
-        self.drawString(
-            0.75 * 72,  # 0.75 inch in points
-            0.5 * 72,   # 0.5 inch in points
-            f"Cloud202 - {self.report_type}"
-        )
+        self.setFillColor(colors.grey)
+        self.drawString(self._FOOTER_X, self._FOOTER_Y, self._footer_text)
         # Footer line
         self.setStrokeColor(colors.lightgrey)
         self.setLineWidth(0.5)
-        self.line(0.75 * 72, 0.65 * 72, A4[0] - 0.75 * 72, 0.65 * 72)
+        self.line(self._FOOTER_X, self._LINE_Y, self._LINE_X2, self._LINE_Y)
+
+    def draw_page_number(self, page_number, page_count):
+        self.setFont("Helvetica", 9)
+        self.setFillColor(colors.grey)
+        self.drawCentredString(
+            self._CENTER_X,
+            self._PAGE_NUM_Y,
+            f"Page {page_number} of {page_count}"
+        )
 
 
 class EnhancedNumberedCanvas(canvas.Canvas):
     """Professional page numbering with dynamic company name"""
+
+    # Footer geometry in points, precomputed for the per-page draw
+    _MARGIN_X = 0.5 * 72
+    _TEXT_Y = 0.5 * 72
+    _LINE_Y = 0.7 * 72
+    _RIGHT_X = A4[0] - 0.5 * 72
+
     def __init__(self, *args, **kwargs):
         self.company_name = kwargs.pop('company_name', 'Cloud202')
         self.report_type = kwargs.pop('report_type', 'Assessment Report')
         canvas.Canvas.__init__(self, *args, **kwargs)
-        self._saved_page_states = []
+        # Footer text is fixed for the document, so format it once rather than per page
+        self._footer_text = f"{self.company_name} - {self.report_type}"
+        self._page_count = 0
+        # Page numbers whose "Page N of M" form is filled in once M is known
+        self._numbered_pages = []
 
     def showPage(self):
-        self._saved_page_states.append(dict(self.__dict__))
-        self._startPage()
+        # Single pass: footers are drawn as each page finishes, with the page number in a
+        # per-page form completed in save(); no page state is snapshotted or replayed.
+        # Skip page numbering on first page (title page)
+        if self._pageNumber != 1:
+            self.draw_footer()
+            self._numbered_pages.append(self._pageNumber)
+        self._page_count += 1
+        canvas.Canvas.showPage(self)
 
     def save(self):
-        num_pages = len(self._saved_page_states)
-        for state in self._saved_page_states:
-            self.__dict__.update(state)
-            self.draw_page_number(num_pages)
-            canvas.Canvas.showPage(self)
+        for page_number in self._numbered_pages:
+            self.beginForm(self._page_number_form(page_number))
+            self.draw_page_number(page_number, self._page_count)
+            self.endForm()
         canvas.Canvas.save(self)
 
-    def draw_page_number(self, page_count):
-        # Skip page numbering on first page (title page)
-        if self._pageNumber == 1:
-            canvas.Canvas.showPage(self)
-            return
+    @staticmethod
+    def _page_number_form(page_number):
+        return f"EnhancedNumberedCanvasPage{page_number}"
 
-        self.setFont("Helvetica", 9)
-        self.setFillColor(colors.HexColor("#666666"))
-        # Page number at bottom right
-        self.drawRightString(
-            A4[0] - 0.5 * 72,
-            0.5 * 72,
-            f"Page {self._pageNumber} of {page_count}"
-        )
+    def draw_footer(self):
+        # Page number at bottom right (form body is drawn in save())
+        self.doForm(self._page_number_form(self._pageNumber))
         # Company footer at bottom left
         self.setFont("Helvetica", 8)
-        self.drawString(
-            0.5 * 72,
-            0.5 * 72,
-            f"{self.company_name} - {self.report_type}"
-        )
+        self.setFillColor(_FOOTER_GREY)
+        self.drawString(self._MARGIN_X, self._TEXT_Y, self._footer_text)
         # Footer line
-        self.setStrokeColor(colors.HexColor("#E0E0E0"))
+        self.setStrokeColor(_FOOTER_RULE)
         self.setLineWidth(0.5)
-        self.line(0.5 * 72, 0.7 * 72, A4[0] - 0.5 * 72, 0.7 * 72)
+        self.line(self._MARGIN_X, self._LINE_Y, self._RIGHT_X, self._LINE_Y)
+
+    def draw_page_number(self, page_number, page_count):
+        self.setFont("Helvetica", 9)
+        self.setFillColor(_FOOTER_GREY)
+        self.drawRightString(
+            self._RIGHT_X,
+            self._TEXT_Y,
+            f"Page {page_number} of {page_count}"
+        )
 
 
-def create_enhanced_styles():
-    """Create enhanced custom styles for Cloud202 reports"""
-    styles = getSampleStyleSheet()
-    
-    # Only add styles if they don't already exist
-    style_names = [s.name for s in styles.byName.values()]
-    
+# Custom paragraph styles, registered in order; 'parent' names a sample style.
+# Names already present in the sample sheet (e.g. 'BodyText') are left as-is.
+_STYLE_SPECS = (
     # New enhanced styles
-    if 'TitleMain' not in style_names:
-        styles.add(ParagraphStyle(
-            name='TitleMain',
-            parent=styles['Title'],
-            fontSize=36,
-            leading=42,
-            textColor=colors.HexColor('#1a365d'),
-            spaceAfter=20,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-    
-    if 'TitleSub' not in style_names:
-        styles.add(ParagraphStyle(
-            name='TitleSub',
-            parent=styles['Normal'],
-            fontSize=14,
-            leading=18,
-            textColor=colors.HexColor('#2c5282'),
-            spaceAfter=12,
-            alignment=TA_CENTER,
-            fontName='Helvetica'
-        ))
-    
-    if 'BodyTextEnhanced' not in style_names:
-        styles.add(ParagraphStyle(
-            name='BodyTextEnhanced',
-            parent=styles['Normal'],
-            fontSize=11,
-            leading=16,
-            textColor=colors.HexColor('#2d3748'),
-            spaceAfter=12,
-            alignment=TA_JUSTIFY,
-            fontName='Helvetica',
-            leftIndent=12
-        ))
-    
+    dict(
+        name='TitleMain',
+        parent='Title',
+        fontSize=36,
+        leading=42,
+        textColor=_NAVY,
+        spaceAfter=20,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ),
+    dict(
+        name='TitleSub',
+        parent='Normal',
+        fontSize=14,
+        leading=18,
+        textColor=_BLUE,
+        spaceAfter=12,
+        alignment=TA_CENTER,
+        fontName='Helvetica'
+    ),
+    dict(
+        name='BodyTextEnhanced',
+        parent='Normal',
+        fontSize=11,
+        leading=16,
+        textColor=_SLATE,
+        spaceAfter=12,
+        alignment=TA_JUSTIFY,
+        fontName='Helvetica',
+        leftIndent=12
+    ),
     # Legacy styles (keep for backward compatibility)
-    if 'TitlePage' not in style_names:
-        styles.add(ParagraphStyle(
-            name='TitlePage',
-            parent=styles['Title'],
-            fontSize=32,
-            leading=38,
-            textColor=colors.HexColor('#1a365d'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-    
-    if 'Subtitle' not in style_names:
-        styles.add(ParagraphStyle(
-            name='Subtitle',
-            parent=styles['Normal'],
-            fontSize=14,
-            leading=18,
-            textColor=colors.HexColor('#2d3748'),
-            spaceAfter=20,
-            alignment=TA_CENTER,
-            fontName='Helvetica'
-        ))
-    
-    if 'MainHeading' not in style_names:
-        styles.add(ParagraphStyle(
-            name='MainHeading',
-            parent=styles['Heading1'],
-            fontSize=18,
-            leading=22,
-            textColor=colors.HexColor('#1a365d'),
-            spaceAfter=12,
-            spaceBefore=14,
-            fontName='Helvetica-Bold',
-            backColor=colors.HexColor('#E8F0FF'),
-            leftIndent=12,
-            rightIndent=12,
-            borderPadding=10
-        ))
-    
-    if 'SectionHeading' not in style_names:
-        styles.add(ParagraphStyle(
-            name='SectionHeading',
-            parent=styles['Heading2'],
-            fontSize=13,
-            leading=16,
-            textColor=colors.HexColor('#2c5282'),
-            spaceAfter=10,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        ))
-    
-    if 'SubsectionHeading' not in style_names:
-        styles.add(ParagraphStyle(
-            name='SubsectionHeading',
-            parent=styles['Heading3'],
-            fontSize=12,
-            leading=15,
-            textColor=colors.HexColor('#425282'),
-            spaceAfter=8,
-            spaceBefore=10,
-            fontName='Helvetica-Bold'
-        ))
-    
-    if 'BodyText' not in style_names:
-        styles.add(ParagraphStyle(
-            name='BodyText',
-            parent=styles['Normal'],
-            fontSize=10,
-            leading=14,
-            textColor=colors.HexColor('#2d3748'),
-            spaceAfter=10,
-            alignment=TA_JUSTIFY,
-            fontName='Helvetica'
-        ))
-    
-    if 'BulletPoint' not in style_names:
-        styles.add(ParagraphStyle(
-            name='BulletPoint',
-            parent=styles['Normal'],
-            fontSize=10,
-            leading=14,
-            textColor=colors.HexColor('#2d3748'),
-            leftIndent=20,
-            bulletIndent=10,
-            spaceAfter=6,
-            fontName='Helvetica',
-            bulletFontName='Helvetica'
-        ))
-    
-    if 'HighlightBox' not in style_names:
-        styles.add(ParagraphStyle(
-            name='HighlightBox',
-            parent=styles['Normal'],
-            fontSize=10,
-            leading=14,
-            textColor=colors.HexColor('#1a365d'),
-            backColor=colors.HexColor('#fef5e7'),
-            borderWidth=1,
-            borderColor=colors.HexColor('#f39c12'),
-            borderPadding=10,
-            borderRadius=3,
-            spaceAfter=12,
-            spaceBefore=12
-        ))
-    
+    dict(
+        name='TitlePage',
+        parent='Title',
+        fontSize=32,
+        leading=38,
+        textColor=_NAVY,
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    ),
+    dict(
+        name='Subtitle',
+        parent='Normal',
+        fontSize=14,
+        leading=18,
+        textColor=_SLATE,
+        spaceAfter=20,
+        alignment=TA_CENTER,
+        fontName='Helvetica'
+    ),
+    dict(
+        name='MainHeading',
+        parent='Heading1',
+        fontSize=18,
+        leading=22,
+        textColor=_NAVY,
+        spaceAfter=12,
+        spaceBefore=14,
+        fontName='Helvetica-Bold',
+        backColor=_BG_BLUE,
+        leftIndent=12,
+        rightIndent=12,
+        borderPadding=10
+    ),
+    dict(
+        name='SectionHeading',
+        parent='Heading2',
+        fontSize=13,
+        leading=16,
+        textColor=_BLUE,
+        spaceAfter=10,
+        spaceBefore=12,
+        fontName='Helvetica-Bold'
+    ),
+    dict(
+        name='SubsectionHeading',
+        parent='Heading3',
+        fontSize=12,
+        leading=15,
+        textColor=_INDIGO,
+        spaceAfter=8,
+        spaceBefore=10,
+        fontName='Helvetica-Bold'
+    ),
+    dict(
+        name='BodyText',
+        parent='Normal',
+        fontSize=10,
+        leading=14,
+        textColor=_SLATE,
+        spaceAfter=10,
+        alignment=TA_JUSTIFY,
+        fontName='Helvetica'
+    ),
+    dict(
+        name='BulletPoint',
+        parent='Normal',
+        fontSize=10,
+        leading=14,
+        textColor=_SLATE,
+        leftIndent=20,
+        bulletIndent=10,
+        spaceAfter=6,
+        fontName='Helvetica',
+        bulletFontName='Helvetica'
+    ),
+    dict(
+        name='HighlightBox',
+        parent='Normal',
+        fontSize=10,
+        leading=14,
+        textColor=_NAVY,
+        backColor=_BG_AMBER,
+        borderWidth=1,
+        borderColor=_BORDER_AMBER,
+        borderPadding=10,
+        borderRadius=3,
+        spaceAfter=12,
+        spaceBefore=12
+    ),
+)
+
+
+# Stylesheet built on first use and shared afterwards; callers only read from it
+_STYLES_CACHE = None
+
+
+def create_enhanced_styles():
+    """Create enhanced custom styles for Cloud202 reports (built once per process)"""
+    global _STYLES_CACHE
+    if _STYLES_CACHE is not None:
+        return _STYLES_CACHE
+
+    styles = getSampleStyleSheet()
+
+    # Only add styles if they don't already exist (byName is a dict: O(1) lookup)
+    for spec in _STYLE_SPECS:
+        if spec['name'] not in styles.byName:
+            styles.add(ParagraphStyle(**{**spec, 'parent': styles[spec['parent']]}))
+
+    _STYLES_CACHE = styles
     return styles
 
+
+# Title-page details table style, shared by all report types; TableStyle is only read when
+# applied to a table, so one instance serves every report
+_TITLE_TABLE_STYLE = None
+
+
+def create_title_table_style():
+    """Title-page details TableStyle for Cloud202 reports (built once per process)"""
+    global _TITLE_TABLE_STYLE
+    if _TITLE_TABLE_STYLE is None:
+        _TITLE_TABLE_STYLE = TableStyle([
+            ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 11),
+            ('FONT', (1, 0), (1, -1), 'Helvetica', 11),
+            ('TEXTCOLOR', (0, 0), (-1, -1), _BLUE),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, _ROW_ALT]),
+            ('TOPPADDING', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+            ('LINEBELOW', (0, 0), (-1, -1), 0.5, _FOOTER_RULE),
+        ])
+    return _TITLE_TABLE_STYLE
@@ -0,0 +1,51 @@
+"""
+Shared helpers for the Cloud202 report generators
+Text heuristics and constants used by the Executive, Technical, and Compliance reports
+"""
+
+import re
+from typing import Any, Dict
+
+__all__ = ['PATH_STRIP_CHARS', 'SAFE_NAME_RE', 'EMPTY', 'infer_industry', 'is_subsection']
+
+# Whitespace plus the quotes users often paste around file paths, stripped in one call
+PATH_STRIP_CHARS = " \t\r\n\"'"
+
+# Characters not allowed in report file names; compiled once at import
+SAFE_NAME_RE = re.compile(r'[^A-Za-z0-9_-]+')
+
+# Shared read-only stand-in for a missing "delta", avoiding a new {} per stream event
+EMPTY: Dict[str, Any] = {}
+
+# Industry buckets in priority order, matched as substrings of the problem statement
+_INDUSTRY_KEYWORDS = (
+    ('Healthcare Technology', ('clinical', 'physician', 'patient', 'healthcare', 'medical')),
+    ('Financial Technology', ('financial', 'banking', 'fintech', 'payment', 'trading', 'market')),
+    ('Manufacturing & Automotive', ('vehicle', 'manufacturing', 'automotive')),
+)
+# One capture group per bucket, so match.lastindex - 1 is the bucket's rank. The zero-width
+# lookahead sees overlapping keywords, as with the per-word `in` checks; IGNORECASE replaces
+# lowercasing the whole (possibly multi-KB) problem text first.
+_INDUSTRY_RE = re.compile(
+    '(?=' + '|'.join('(' + '|'.join(map(re.escape, words)) + ')' for _, words in _INDUSTRY_KEYWORDS) + ')',
+    re.IGNORECASE
+)
+
+
+def infer_industry(problem: str) -> str:
+    """Infer the industry label from a free-text problem statement ('Technology' if none match)."""
+    # One scan for every keyword; the earliest bucket in _INDUSTRY_KEYWORDS wins
+    best = len(_INDUSTRY_KEYWORDS)
+    for match in _INDUSTRY_RE.finditer(problem):
+        best = min(best, match.lastindex - 1)
+        if best == 0:
+            break
+    return _INDUSTRY_KEYWORDS[best][0] if best < len(_INDUSTRY_KEYWORDS) else 'Technology'
+
+
+def is_subsection(para: str) -> bool:
+    """Heading heuristic: ends with a colon, or a short capitalized line of at most 8 words."""
+    if para.endswith(':'):
+        return True
+    # Cheap length/case checks first, so only short lines pay for the (bounded) word split
+    return len(para) < 80 and para[0].isupper() and len(para.split(None, 8)) <= 8
@@ -6,11 +6,13 @@ import importlib
 import json
 import logging
 import os
-import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+from functools import lru_cache, partial
+from datetime import datetime, timezone
 from pathlib import Path
+from time import perf_counter
 from typing import Any, Dict, Optional, Callable, Tuple
 
 # Configure logging
@@ -20,18 +22,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Ensure project root and src are importable for flexible module resolution
+# Run as a module from the project root (python -m src.run_parallel) so `src.*` resolves
 CURRENT_FILE = Path(__file__).resolve()
 PROJECT_ROOT = CURRENT_FILE.parent.parent
-SRC_DIR = PROJECT_ROOT / "src"
-
-for path_candidate in [SRC_DIR, PROJECT_ROOT]:
-    try:
-        if str(path_candidate) not in sys.path:
-            sys.path.insert(0, str(path_candidate))
-    except Exception:
-        # Best-effort path setup; continue even if some insertions fail
-        pass
 
 DATA_DIR = (PROJECT_ROOT / "reports").resolve()
 
@@ -46,88 +39,80 @@ class ReportResult:
     finished_at: Optional[str] = None
     duration_seconds: Optional[float] = None
 
+def _shallow_dict(result: ReportResult) -> Dict[str, Any]:
+    """Field dict for the manifest; unlike asdict, does not deep-copy the (possibly large) extra payload."""
+    return {f.name: getattr(result, f.name) for f in fields(result)}
+
 def _timestamp() -> str:
-    return datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 def _timeit(fn: Callable[[], Any]) -> Tuple[Any, float]:
-    import time
-    t0 = time.time()
+    # Monotonic, high-resolution clock: durations are immune to wall-clock adjustments
+    t0 = perf_counter()
     val = fn()
-    return val, time.time() - t0
-
+    return val, perf_counter() - t0
+
+# Report type -> (module, class) of its generator
+_GENERATORS = {
+    "executive": ("src.executive_report", "Cloud202ExecutiveReportGenerator"),
+    "technical": ("src.technical_report", "Cloud202TechnicalDeepDiveGenerator"),
+    "compliance": ("src.compliance_report", "ComplianceReportGenerator"),
+}
+
+@lru_cache(maxsize=None)
+def _generator_class(report_type: str) -> type:
+    """Import and resolve a generator class once per process (import errors are not cached)."""
+    module_name, class_name = _GENERATORS[report_type]
+    return getattr(importlib.import_module(module_name), class_name)
+
+# A fresh instance per run: generators stamp filenames and dates at construction
 def _load_executive_generator():
-    candidates = [
-        ("report_labs_executive", "Cloud202ExecutiveReportGenerator"),
-        ("src.executive_report", "Cloud202ExecutiveReportGenerator"),
-        ("executive_report", "Cloud202ExecutiveReportGenerator"),
-        ("report_labs_executive", None),
-        ("executive_report", None),
-    ]
-    last_err = None
-    for mod_name, cls_name in candidates:
-        try:
-            mod = importlib.import_module(mod_name)
-            if cls_name:
-                cls = getattr(mod, cls_name, None)
-                if cls is None:
-                    raise AttributeError(f"{mod_name} has no class {cls_name}")
-                inst = cls()
-                if not hasattr(inst, "generate_report"):
-                    raise AttributeError(f"{cls_name} missing generate_report")
-                return inst, "generate_report"
-            else:
-                if hasattr(mod, "generate_report"):
-                    return mod, "generate_report"
-                if hasattr(mod, "main"):
-                    def call_main(json_path: str):
-                        return mod.main(["--json_path", json_path]) if callable(mod.main) else None
-                    return type("MainWrapper", (), {"generate_report": staticmethod(call_main)})(), "generate_report"
-        except Exception as e:
-            last_err = e
-            continue
-    raise ImportError(f"Could not locate an Executive report generator. Last error: {last_err}")
+    return _generator_class("executive")(), "generate_report"
 
 def _load_technical_generator():
-    candidates = [
-        ("src.technical_report", "Cloud202TechnicalDeepDiveGenerator"),
-        ("technical_report", "Cloud202TechnicalDeepDiveGenerator"),
-    ]
-    last_err = None
-    for mod_name, cls_name in candidates:
-        try:
-            mod = importlib.import_module(mod_name)
-            cls = getattr(mod, cls_name, None)
-            if cls is None:
-                raise AttributeError(f"{mod_name} has no class {cls_name}")
-            inst = cls()
-            if not hasattr(inst, "generate_report"):
-                raise AttributeError("Technical generator missing generate_report")
-            return inst
-        except Exception as e:
-            last_err = e
-            continue
-    raise ImportError(f"Could not locate Technical report generator. Last error: {last_err}")
+    return _generator_class("technical")()
 
 def _load_compliance_generator():
-    candidates = [
-        ("src.compliance_report", "ComplianceReportGenerator"),
-        ("compliance_report", "ComplianceReportGenerator"),
-    ]
-    last_err = None
-    for mod_name, cls_name in candidates:
+    return _generator_class("compliance")()
+
+def _init_worker(report_types: Tuple[str, ...]) -> None:
+    """Process-pool initializer: import the selected generators and warm their per-process
+    caches (Bedrock client, stylesheet) so a worker's first job does not start cold.
+
+    The warm-up instances are discarded; each job still builds its own generator.
+    """
+    loaders = {
+        "executive": _load_executive_generator,
+        "technical": _load_technical_generator,
+        "compliance": _load_compliance_generator,
+    }
+    for name in report_types:
         try:
-            mod = importlib.import_module(mod_name)
-            cls = getattr(mod, cls_name, None)
-            if cls is None:
-                raise AttributeError(f"{mod_name} has no class {cls_name}")
-            inst = cls()
-            if not hasattr(inst, "generate_report"):
-                raise AttributeError("Compliance generator missing generate_report")
-            return inst
+            loaders[name]()
         except Exception as e:
-            last_err = e
-            continue
-    raise ImportError(f"Could not locate Compliance report generator. Last error: {last_err}")
+            # Never fail the pool here; the job itself reports the loader error
+            logger.warning(f"Worker warm-up for {name} failed: {e}")
+
+# Keys kept from a generator's result dict in ReportResult.extra (and so in the manifest).
+# Executive/Technical results also carry the generated text and the processed assessment,
+# which nothing downstream reads; company_name/industry are lifted out of their "meta".
+_EXTRA_KEYS = ("pdf_path", "output_path", "company_name", "industry", "timestamp", "assessment_date")
+
+def _coerce_result(result: Any) -> Tuple[Optional[str], Dict[str, Any]]:
+    """Split a generator's return value into (output_path, extra) for ReportResult."""
+    if isinstance(result, dict):
+        output_path = result.get("output_path") or result.get("pdf_path")
+        meta = result.get("meta")
+        sources = (result, meta) if isinstance(meta, dict) else (result,)
+        extra: Dict[str, Any] = {}
+        for source in sources:
+            for key in _EXTRA_KEYS:
+                if key in source and key not in extra:
+                    extra[key] = source[key]
+        return (str(output_path) if output_path else None), extra
+    if isinstance(result, str):
+        return (result if result.lower().endswith(".pdf") else None), {"return": result}
+    return None, {"return": str(result)}
 
 def run_executive(json_path: str) -> ReportResult:
     started = _timestamp()
@@ -136,13 +121,8 @@ def run_executive(json_path: str) -> ReportResult:
         def _do():
             return getattr(exec_inst, method_name)(json_path)
         result, dur = _timeit(_do)
-        output_path = None
-        if isinstance(result, dict):
-            output_path = result.get("output_path") or result.get("pdf_path")
-        if isinstance(result, str) and result.lower().endswith(".pdf"):
-            output_path = result
-        return ReportResult(name="executive", status="success", output_path=str(output_path) if output_path else None,
-                            extra=result if isinstance(result, dict) else {"return": str(result)},
+        output_path, extra = _coerce_result(result)
+        return ReportResult(name="executive", status="success", output_path=output_path, extra=extra,
                             started_at=started, finished_at=_timestamp(), duration_seconds=dur)
     except Exception as e:
         logger.exception("Executive report failed")
@@ -156,13 +136,8 @@ def run_technical(json_path: str) -> ReportResult:
         def _do():
             return tech.generate_report(json_path)
         result, dur = _timeit(_do)
-        output_path = None
-        if isinstance(result, dict):
-            output_path = result.get("output_path") or result.get("pdf_path")
-        if isinstance(result, str) and result.lower().endswith(".pdf"):
-            output_path = result
-        return ReportResult(name="technical", status="success", output_path=str(output_path) if output_path else None,
-                            extra=result if isinstance(result, dict) else {"return": str(result)},
+        output_path, extra = _coerce_result(result)
+        return ReportResult(name="technical", status="success", output_path=output_path, extra=extra,
                             started_at=started, finished_at=_timestamp(), duration_seconds=dur)
     except Exception as e:
         logger.exception("Technical report failed")
@@ -176,13 +151,8 @@ def run_compliance(json_path: str, force: bool = True) -> ReportResult:
         def _do():
             return comp.generate_report(json_path, force=force)
         result, dur = _timeit(_do)
-        output_path = None
-        if isinstance(result, dict):
-            output_path = result.get("output_path") or result.get("pdf_path")
-        if isinstance(result, str) and result.lower().endswith(".pdf"):
-            output_path = result
-        return ReportResult(name="compliance", status="success", output_path=str(output_path) if output_path else None,
-                            extra=result if isinstance(result, dict) else {"return": str(result)},
+        output_path, extra = _coerce_result(result)
+        return ReportResult(name="compliance", status="success", output_path=output_path, extra=extra,
                             started_at=started, finished_at=_timestamp(), duration_seconds=dur)
     except Exception as e:
         logger.exception("Compliance report failed")
@@ -197,7 +167,7 @@ def main(argv=None):
     parser.add_argument("--no-exec", dest="no_exec", action="store_true", help="Skip Executive report")
     parser.add_argument("--no-tech", dest="no_tech", action="store_true", help="Skip Technical report")
     parser.add_argument("--no-comp", dest="no_comp", action="store_true", help="Skip Compliance report")
-    parser.add_argument("--threads", dest="threads", type=int, default=3, help="Max threads to use")
+    parser.add_argument("--threads", dest="threads", type=int, default=3, help="Max worker processes to use")
     args = parser.parse_args(argv)
 
     json_path = Path(args.json_path).expanduser().resolve()
@@ -216,13 +186,20 @@ def main(argv=None):
     if not args.no_tech:
         jobs.append(("technical", run_technical, str(json_path)))
     if not args.no_comp:
-        jobs.append(("compliance", lambda p: run_compliance(p, force=True), str(json_path)))
+        jobs.append(("compliance", partial(run_compliance, force=True), str(json_path)))
 
     if not jobs:
         raise SystemExit("No reports selected.")
 
     results: Dict[str, ReportResult] = {}
-    with ThreadPoolExecutor(max_workers=min(args.threads, len(jobs))) as ex:
+    # Worker processes, so the CPU-bound ReportLab builds run on separate cores instead of
+    # sharing one GIL. "spawn" gives each worker a clean interpreter: generator modules,
+    # boto3 clients and ReportLab state are created inside the worker, never inherited.
+    # Job callables are module-level functions/partials so they pickle.
+    with ProcessPoolExecutor(max_workers=min(args.threads, len(jobs)),
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_worker,
+                             initargs=(tuple(name for name, _fn, _param in jobs),)) as ex:
         future_map = {ex.submit(fn, param): (name, fn) for name, fn, param in jobs}
         for fut in as_completed(future_map):
             name, _fn = future_map[fut]
@@ -238,10 +215,12 @@ def main(argv=None):
         "run_id": run_id,
         "json": str(json_path),
         "created_at": _timestamp(),
-        "results": {k: asdict(v) for k, v in results.items()},
+        "results": {k: _shallow_dict(v) for k, v in results.items()},
     }
     manifest_path = outdir / f"manifest_{run_id}.json"
-    manifest_path.write_text(json.dumps(manifest, indent=2))
+    # Stream the encoder's chunks straight to the file instead of building the whole string
+    with manifest_path.open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
 
     print("\\n===== Parallel Report Run Summary =====")
     for name in ("executive", "technical", "compliance"):
@@ -2,37 +2,194 @@
 """
 Cloud202 Technical Implementation Deep-Dive Generator (Compliance-style runtime)
 
-- Uses centralized BedrockConfig with inference profile + invoke_model (like compliance_report.py)
+- Uses centralized BedrockConfig with inference profile + invoke_model_with_response_stream,
+  one concurrent streamed request per section
 - Preserves Technical prompt/section schema and tone
 - Renders PDF using the same layout primitives as the compliance report
 """
 
+import hashlib
+import io
 import json
 import logging
-import re
+import os
+import tempfile
 import argparse
 from datetime import datetime
+from functools import cached_property
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Any, Optional, Tuple
 
-# Centralized Bedrock configuration
+# Shared JSON codec (orjson when installed, stdlib json otherwise)
+from src.json_codec import json_loads, json_dumps, json_dumps_indented
+from src.report_utils import EMPTY, SAFE_NAME_RE, infer_industry, is_subsection
+
+# Centralized Bedrock configuration (boto3 itself is imported on first client creation)
 from src.bedrock_config import BedrockConfig
 
-# ReportLab & shared styles (same as compliance)
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+# ReportLab and the shared canvas/styles are imported where the PDF is built, so CLI
+# start-up and fallback-only runs do not pay for them
+
+# Library logger: handlers and levels belong to the application (see main() for the CLI)
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Fallback section bodies, left-aligned so no source indentation leaks into the content;
+# placeholders are filled from processed data with str.format_map
+_FALLBACK_TEMPLATES = {
+    'current_state_assessment': """CURRENT STATE ASSESSMENT
+
+{company_name} operates a mixed estate typical of {industry} workloads with legacy monoliths, point-to-point integrations,
+and limited automation. Baseline SLOs are inconsistent across tiers, and capacity headroom is constrained during peak windows.
+Observability coverage exists but lacks uniform correlation across logs/metrics/traces; incident triage is manual and reactive.
+Identity is centrally managed but privileges are coarse-grained, and secret rotation is inconsistent across services.""",
+
+    'target_architecture_design': """TARGET ARCHITECTURE DESIGN
+
+Recommended blueprint: multi-AZ VPC, private subnets, ALB fronting ECS/Fargate services, Aurora PostgreSQL with read replicas,
+S3 data lake (prefix+partition design), ElastiCache (Redis) for hot paths, and Bedrock for GenAI workloads. CI/CD via Terraform,
+pipelines with policy-as-code and environment promotions; WAF/Shield at the edge; centralized KMS keys and CloudTrail/Lake
+for audit. DR uses cross-AZ plus periodic cross-Region backups with documented RTO/RPO.""",
+
+    'data_strategy': """DATA STRATEGY
+
+Ingest via event streams and batch pipelines; schema control with Glue Catalog and Lake Formation. Data classification
+(Restricted/Confidential/Internal/Public) governs RBAC/ABAC policies. Storage tiering uses S3 Standard → IA → Glacier with
+lifecycle transitions. Encryption everywhere with KMS; tokenization for sensitive fields; metadata capture for lineage; RAG
+retrieval patterns with curated embeddings and vector index separation by tenancy.""",
+
+    'model_evaluation_recommendations': """MODEL EVALUATION RECOMMENDATIONS
+
+Adopt offline golden sets and online A/B with guardrails. Track hallucination/toxicity, latency, cost, and success metrics with
+SLIs/SLOs. Introduce HITL review queues for high-risk classes and regression gates in CI. Cache strategies reduce cost/latency;
+error isolation via circuit breakers and fallback responders. Clear acceptance criteria and rollback signals are codified.""",
+
+    'implementation_plan': """IMPLEMENTATION PLAN
+
+Phase 1 (1–2): Foundations & baselining; envs, IaC, observability, security controls. Phase 2 (3–5): Core build (APIs, data
+pipelines, guardrails). Phase 3 (6–7): Testing (load, security, UAT, perf tuning). Phase 4 (8): Deployment (blue/green,
+rollback, DR test). Phase 5 (9–10): Stabilization, SRE playbooks, KT/handover. RACI with dependency mapping and risks/mitigations.""",
+
+    'integration_and_operations': """INTEGRATION AND OPERATIONS
+
+Contracts specify authZ scopes, idempotency, and backoff. Observability: CloudWatch/X-Ray + custom metrics, unified
+dashboards, actionable alerts. Day-2 ops includes patching cadence, incident runbooks, change controls, DR drills,
+backup/restore tests, cost budgets with anomaly detection, and continuous compliance evidence capture.""",
+}
+
+# Sampling temperature for section requests (also part of the response-cache key)
+_TEMPERATURE = 0.3
+
+# Completion budget per section, sized to its word target plus tool-input JSON overhead;
+# capped at the configured technical token limit
+_SECTION_MAX_TOKENS = {
+    "current_state_assessment": 4000,
+    "target_architecture_design": 4000,
+    "data_strategy": 3000,
+    "model_evaluation_recommendations": 3000,
+    "implementation_plan": 4000,
+    "integration_and_operations": 3500,
+}
+
+# Largely templated sections routed to the fast model; the rest stay on the default model
+_FAST_MODEL_SECTIONS = frozenset({"current_state_assessment", "integration_and_operations"})
+
+# Response cache location used when BEDROCK_CACHE=1 and no cache_dir is passed
+_DEFAULT_CACHE_DIR = ".bedrock_cache"
+
+# PDF section order: (heading, content key returned by the model)
+_SECTIONS = (
+    ("Current State Assessment", "current_state_assessment"),
+    ("Target Architecture Design", "target_architecture_design"),
+    ("Data Strategy", "data_strategy"),
+    ("Model Evaluation Recommendations", "model_evaluation_recommendations"),
+    ("Implementation Plan", "implementation_plan"),
+    ("Integration & Operations", "integration_and_operations"),
+)
+
+# Report context shared by all six section requests, sent as a cached system block so
+# Bedrock can reuse its processed prefix instead of re-reading the assessment per section
+_CONTEXT_PROMPT_TEMPLATE = """You are a senior Cloud202 Solutions Architect drafting one section of a TECHNICAL IMPLEMENTATION DEEP-DIVE report.
+
+COMPANY: {company_name}
+INDUSTRY: {industry}
+ASSESSMENT DATA:
+{assessment_json}
 
-# Shared canvas & styles (same as compliance)
-from src.report_styles import EnhancedNumberedCanvas, create_enhanced_styles
+FORMATTING RULES:
+- Use dense technical prose; keep bullets for lists inside the section text
+- Include specific AWS services/configs; avoid vague statements
+- No markdown, markdown tables or code fences in the section text; use prose and simple lists
+"""
+
+# Per-section user message; only the section spec varies between calls
+_SECTION_PROMPT_TEMPLATE = """Write ONLY this section and submit it with the submit_section tool, in its "text" field.
+
+SECTION DETAILS:
+
+{section_spec}
+"""
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(filename)s - %(levelname)s - %(message)s'
+# Per-section prompt specs (key, details), in report order
+_SECTION_SPECS = (
+    ("current_state_assessment", """CURRENT STATE ASSESSMENT (900–1100 words):
+- Existing system architecture/topology, runtime, deployment model
+- Baseline performance/availability, SLOs/SLAs, capacity headroom
+- Observed bottlenecks (I/O/CPU/memory/network), failure modes, error patterns
+- Security/compliance posture, identity model, secrets, logging, audit trails
+- Environmental constraints (cost, skills, processes, vendor lock-in)
+- Include 4–6 paragraphs with crisp technical prose"""),
+    ("target_architecture_design", """TARGET ARCHITECTURE DESIGN (900–1100 words):
+- Recommended AWS reference architecture (compute, networking, storage, data)
+- Traffic flow, ALB/NLB, WAF/Shield, VPC design, SG/NACL policy
+- Data plane vs control plane, tenancy, multi-AZ, DR strategy (RTO/RPO)
+- GenAI components (Bedrock, embedding/retrieval), caching (ElastiCache), database (Aurora/RDS/DynamoDB)
+- CI/CD with IaC (Terraform), env strategy, feature flags, blue/green/canary
+- 4–6 paragraphs with specific AWS services and configurations"""),
+    ("data_strategy", """DATA STRATEGY (700–900 words):
+- Data classification, lineage, governance (Glue, Lake Formation)
+- Ingestion, quality, schema evolution, CDC, partitioning
+- Storage tiers (S3 classes), lifecycle, encryption (KMS), tokenization/pseudonymization
+- Metadata/catalog, access policies (RBAC/ABAC), data products, privacy
+- Retrieval/RAG patterns, embeddings, vector index strategy
+- 3–5 paragraphs with explicit implementation detail"""),
+    ("model_evaluation_recommendations", """MODEL EVALUATION RECOMMENDATIONS (700–900 words):
+- Offline/online eval, golden sets, regression gates, eval harness
+- Hallucination checks, safety/guardrails, prompt/response policies
+- Human-in-the-loop, A/B testing, acceptance criteria, SLI/SLO for quality
+- Cost/perf tradeoffs, caching strategies, failure isolation
+- 3–5 paragraphs, actionable and measurable"""),
+    ("implementation_plan", """IMPLEMENTATION PLAN (900–1100 words):
+- Phase 1 (Months 1–2): Foundations & baselining (environments, IaC, observability)
+- Phase 2 (Months 3–5): Core development (APIs, data pipelines, initial guardrails)
+- Phase 3 (Months 6–7): Testing/validation (load, security, UAT, perf tuning)
+- Phase 4 (Month 8): Deployment (blue/green, rollback, runbooks, DR test)
+- Phase 5 (Months 9–10): Stabilization/optimization (SRE playbooks, KT, handover)
+- Resourcing, RACI, dependency management, risks, mitigations"""),
+    ("integration_and_operations", """INTEGRATION AND OPERATIONS (800–1000 words):
+- Integration contracts (API specs, authN/Z, throttling); data exchange patterns
+- Observability stack (CloudWatch, X-Ray, metrics/alerts), SLOs & error budgets
+- Ops playbooks: incident response, change mgmt, patching, capacity
+- Performance mgmt (load profiles, autoscaling), cost mgmt (budgets/anomaly)
+- Day-2 ops: DR drills, backup/restore tests, compliance evidence capture"""),
 )
-logger = logging.getLogger(__name__)
+
+
+# Anthropic tool definition: with tool_choice forcing it, the model returns the section as
+# already-structured tool input instead of free text that has to be un-fenced. It is the
+# same for every section, since tools lead the prompt-cache prefix.
+_SECTION_TOOL = {
+    "name": "submit_section",
+    "description": "Submit the finished report section.",
+    "input_schema": {
+        "type": "object",
+        "properties": {"text": {"type": "string"}},
+        "required": ["text"],
+    },
+}
+_TOOL_CHOICE = {"type": "tool", "name": "submit_section"}
 
 
 class Cloud202TechnicalDeepDiveGenerator:
@@ -40,44 +197,68 @@ class Cloud202TechnicalDeepDiveGenerator:
     Cloud202 Technical Implementation Deep-Dive Generator using compliance-style Bedrock invocation.
     """
 
-    def __init__(self, aws_region: str = None):
-        # Timestamp for outputs
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
+    def __init__(self, aws_region: str = None, cache_dir: Optional[str] = None):
         # Region from centralized config
         self.aws_region = aws_region or BedrockConfig.get_region("technical")
 
         # Use the regional inference profile ARN (same approach as compliance)
         self.model_id = BedrockConfig.get_inference_profile_arn(self.aws_region)
+        self.fast_model_id = BedrockConfig.get_fast_inference_profile_arn(self.aws_region)
 
         # Log effective config
         BedrockConfig.log_configuration("technical", self.aws_region)
 
-        # Create Bedrock client using centralized timeouts/retries (same as compliance)
+        # Token budget for technical reports
+        self.max_tokens = BedrockConfig.get_token_limit("technical")
+
+        # Output & styles (build_pdf creates the directory when a report is written)
+        self.output_dir = Path("reports")
+
+        # Optional exact-match cache of section responses: off unless a directory is given
+        # or BEDROCK_CACHE=1 is set (dev/QA re-runs), so production calls are unaffected
+        if not cache_dir and os.environ.get("BEDROCK_CACHE") == "1":
+            cache_dir = _DEFAULT_CACHE_DIR
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    @property
+    def timestamp(self) -> str:
+        """Output filename timestamp, taken at call time so one instance can serve many reports."""
+        return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    @property
+    def report_date_iso(self) -> str:
+        """Today's date (YYYY-MM-DD), used when the export carries no exportDate."""
+        return datetime.now().strftime('%Y-%m-%d')
+
+    @cached_property
+    def bedrock_runtime(self):
+        """Bedrock client using centralized timeouts/retries (same as compliance), created on first use.
+
+        The client is safe to share between the section worker threads (boto3 clients are
+        thread-safe; only sessions are not), and its pool is sized for the concurrent streams.
+        """
         try:
-            self.bedrock_runtime = BedrockConfig.create_bedrock_client(
+            client = BedrockConfig.create_bedrock_client(
                 region=self.aws_region,
                 report_type="technical"
             )
             logger.info("✅ AWS Bedrock client initialized for Technical report")
+            return client
         except Exception as e:
             logger.warning(f"⚠️ Bedrock not available: {e}")
-            self.bedrock_runtime = None
+            return None
 
-        # Token budget for technical reports
-        self.max_tokens = BedrockConfig.get_token_limit("technical")
-
-        # Output & styles
-        self.output_dir = Path("reports")
-        self.output_dir.mkdir(exist_ok=True)
-        self.styles = create_enhanced_styles()
+    @cached_property
+    def styles(self):
+        """Shared stylesheet, built on first PDF render."""
+        from src.report_styles import create_enhanced_styles
+        return create_enhanced_styles()
 
     # ---------- IO / Processing ----------
 
     def load_assessment_data(self, json_file_path: str) -> Dict[str, Any]:
         """Load customer assessment responses from JSON file."""
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = json_loads(Path(json_file_path).read_bytes())
         logger.info(f"📖 Loaded assessment data from {json_file_path}")
         return data
 
@@ -95,7 +276,8 @@ class Cloud202TechnicalDeepDiveGenerator:
         processed_data = {
             'company_name': company_name,
             'industry': self._infer_industry(responses),
-            'assessment_date': raw_data.get('exportDate', datetime.now().isoformat())[:10],
+            # Clock read only when the export carries no date
+            'assessment_date': (raw_data.get('exportDate') or self.report_date_iso)[:10],
             'current_state': responses.get('current-state', ''),
             'business_problem': responses.get('business-problems', ''),
             'tech_stack': responses.get('tech-stack', ''),
@@ -109,228 +291,211 @@ class Cloud202TechnicalDeepDiveGenerator:
 
     def _infer_industry(self, responses: Dict[str, Any]) -> str:
         """Infer industry from free-text answers."""
-        problem = (responses.get('business-problems', '') or '').lower()
-        if any(w in problem for w in ['clinical', 'physician', 'patient', 'healthcare', 'medical']):
-            return 'Healthcare Technology'
-        if any(w in problem for w in ['financial', 'banking', 'fintech', 'payment', 'trading', 'market']):
-            return 'Financial Technology'
-        if any(w in problem for w in ['vehicle', 'manufacturing', 'automotive']):
-            return 'Manufacturing & Automotive'
-        return 'Technology'
+        return infer_industry(responses.get('business-problems', '') or '')
 
     # ---------- Prompt ----------
 
-    def create_technical_deepdive_prompt(self, processed_data: Dict[str, Any]) -> str:
+    def _section_prompts(self, processed_data: Dict[str, Any]) -> Tuple[str, Dict[str, str]]:
         """
-        Create the Technical Deep-Dive prompt.
-        (Preserves your original structure/word counts and JSON-only contract.)
+        Create the Technical Deep-Dive prompts: the shared report context (system block)
+        and one section request per section, keyed by section.
+        The static skeletons are the module-level templates; only the header fields and
+        section specs are filled in here, and each section request asks for submit_section.
         """
+        context = _CONTEXT_PROMPT_TEMPLATE.format_map({
+            'company_name': processed_data.get('company_name', 'Customer'),
+            'industry': processed_data.get('industry', 'Technology'),
+            # Serialized once and shared by all six requests
+            'assessment_json': json_dumps_indented(processed_data),
+        })
+        prompts = {
+            key: _SECTION_PROMPT_TEMPLATE.format_map({'section_spec': spec})
+            for key, spec in _SECTION_SPECS
+        }
+        return context, prompts
+
+    # ---------- Bedrock Invocation ----------
 
-        company_name = processed_data.get('company_name', 'Customer')
-        industry = processed_data.get('industry', 'Technology')
-
-        prompt = f"""You are a senior Cloud202 Solutions Architect drafting a TECHNICAL IMPLEMENTATION DEEP-DIVE report.
-
-                COMPANY: {company_name}
-                INDUSTRY: {industry}
-                ASSESSMENT DATA:
-                {json.dumps(processed_data, indent=2)}
-
-                Generate a comprehensive technical report with EXACTLY these 6 JSON keys:
-                {{
-                "current_state_assessment": "...",
-                "target_architecture_design": "...",
-                "data_strategy": "...",
-                "model_evaluation_recommendations": "...",
-                "implementation_plan": "...",
-                "integration_and_operations": "..."
-                }}
-
-                WORD COUNTS (strict):
-                - current_state_assessment: 900–1100 words
-                - target_architecture_design: 900–1100 words
-                - data_strategy: 700–900 words
-                - model_evaluation_recommendations: 700–900 words
-                - implementation_plan: 900–1100 words
-                - integration_and_operations: 800–1000 words
-
-                SECTION DETAILS:
-
-                1. CURRENT STATE ASSESSMENT (900–1100 words):
-                - Existing system architecture/topology, runtime, deployment model
-                - Baseline performance/availability, SLOs/SLAs, capacity headroom
-                - Observed bottlenecks (I/O/CPU/memory/network), failure modes, error patterns
-                - Security/compliance posture, identity model, secrets, logging, audit trails
-                - Environmental constraints (cost, skills, processes, vendor lock-in)
-                - Include 4–6 paragraphs with crisp technical prose
-
-                2. TARGET ARCHITECTURE DESIGN (900–1100 words):
-                - Recommended AWS reference architecture (compute, networking, storage, data)
-                - Traffic flow, ALB/NLB, WAF/Shield, VPC design, SG/NACL policy
-                - Data plane vs control plane, tenancy, multi-AZ, DR strategy (RTO/RPO)
-                - GenAI components (Bedrock, embedding/retrieval), caching (ElastiCache), database (Aurora/RDS/DynamoDB)
-                - CI/CD with IaC (Terraform), env strategy, feature flags, blue/green/canary
-                - 4–6 paragraphs with specific AWS services and configurations
-
-                3. DATA STRATEGY (700–900 words):
-                - Data classification, lineage, governance (Glue, Lake Formation)
-                - Ingestion, quality, schema evolution, CDC, partitioning
-                - Storage tiers (S3 classes), lifecycle, encryption (KMS), tokenization/pseudonymization
-                - Metadata/catalog, access policies (RBAC/ABAC), data products, privacy
-                - Retrieval/RAG patterns, embeddings, vector index strategy
-                - 3–5 paragraphs with explicit implementation detail
-
-                4. MODEL EVALUATION RECOMMENDATIONS (700–900 words):
-                - Offline/online eval, golden sets, regression gates, eval harness
-                - Hallucination checks, safety/guardrails, prompt/response policies
-                - Human-in-the-loop, A/B testing, acceptance criteria, SLI/SLO for quality
-                - Cost/perf tradeoffs, caching strategies, failure isolation
-                - 3–5 paragraphs, actionable and measurable
-
-                5. IMPLEMENTATION PLAN (900–1100 words):
-                - Phase 1 (Months 1–2): Foundations & baselining (environments, IaC, observability)
-                - Phase 2 (Months 3–5): Core development (APIs, data pipelines, initial guardrails)
-                - Phase 3 (Months 6–7): Testing/validation (load, security, UAT, perf tuning)
-                - Phase 4 (Month 8): Deployment (blue/green, rollback, runbooks, DR test)
-                - Phase 5 (Months 9–10): Stabilization/optimization (SRE playbooks, KT, handover)
-                - Resourcing, RACI, dependency management, risks, mitigations
-
-                6. INTEGRATION AND OPERATIONS (800–1000 words):
-                - Integration contracts (API specs, authN/Z, throttling); data exchange patterns
-                - Observability stack (CloudWatch, X-Ray, metrics/alerts), SLOs & error budgets
-                - Ops playbooks: incident response, change mgmt, patching, capacity
-                - Performance mgmt (load profiles, autoscaling), cost mgmt (budgets/anomaly)
-                - Day-2 ops: DR drills, backup/restore tests, compliance evidence capture
-
-                FORMATTING RULES:
-                - Use dense technical prose; keep bullets for lists inside the JSON values
-                - Include specific AWS services/configs; avoid vague statements
-                - STRICT JSON ONLY in the response (no markdown, no code fences)
-                """
-        return prompt
-
-    # ---------- Bedrock Invocation with Streaming ----------
-
-    def generate_report_content(self, processed_data: Dict[str, Any]) -> Dict[str, str]:
-        """Generate technical content using Bedrock streaming for incremental output."""
+    def generate_report_content(self, processed_data: Dict[str, Any],
+                                on_section: Optional[Callable[[str, str], None]] = None) -> Dict[str, str]:
+        """Generate technical content with one concurrent Bedrock call per section.
+
+        If given, on_section(key, text) is called on this thread as each section arrives
+        (fallback sections included), while the remaining sections are still generating.
+        """
         if not self.bedrock_runtime:
             logger.warning("Bedrock runtime not available — using fallback content.")
             return self._generate_fallback_content(processed_data)
 
-        prompt = self.create_technical_deepdive_prompt(processed_data)
-
-        try:
-            logger.info("🤖 Generating technical report content (streaming)…")
-            body = {
-                "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": self.max_tokens,
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.3
+        context, prompts = self._section_prompts(processed_data)
+        logger.info(f"🤖 Generating technical report content ({len(prompts)} sections in parallel)…")
+
+        # Bedrock serves separate requests concurrently, so wall time is the slowest section
+        # rather than the sum; the boto3 client is thread-safe and shared by all workers
+        sections: Dict[str, str] = {}
+        failed = []
+        with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+            futures = {
+                pool.submit(self._generate_section, key, context, prompt): key
+                for key, prompt in prompts.items()
             }
-
-            stream = self.bedrock_runtime.invoke_model_with_response_stream(
-                modelId=self.model_id,
-                body=json.dumps(body)
-            )
-
-            assembled = []
-            event_stream = stream.get("body")
-            for event in event_stream:
-                chunk = event.get("chunk")
-                if not chunk:
-                    continue
+            for future in as_completed(futures):
+                key = futures[future]
                 try:
-                    payload = json.loads(chunk.get("bytes").decode("utf-8"))
-                except Exception:
-                    payload = {"type": "text", "text": chunk.get("bytes").decode("utf-8", errors="ignore")}
-
-                if isinstance(payload, dict):
-                    text_piece = (
-                        payload.get("delta", {}).get("text")
-                        or payload.get("text")
-                        or ""
-                    )
-                else:
-                    text_piece = ""
-
-                if text_piece:
-                    assembled.append(text_piece)
-                    if len(assembled) % 20 == 0:
-                        preview = text_piece.replace('\n', ' ')[:120]
-                        logger.info(f"📝 Stream fragment: {preview}")
-
-            content_text = "".join(assembled)
-            content = self._parse_json_response(content_text)
-            logger.info("✅ Technical content generated via streaming.")
-            return content
-
+                    sections[key] = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Bedrock generation failed for {key}: {e}")
+                    failed.append(key)
+                    continue
+                if on_section is not None:
+                    on_section(key, sections[key])
+
+        if failed:
+            # Only the failed sections fall back; the rest keep their generated text
+            logger.info(f"📋 Using high-quality fallback content for {len(failed)} section(s)...")
+            fallback = self._generate_fallback_content(processed_data)
+            for key in failed:
+                sections[key] = fallback[key]
+                if on_section is not None:
+                    on_section(key, sections[key])
+
+        content = {key: sections[key] for key in prompts}
+        logger.info("✅ Technical content generated.")
+        return content
+
+    def _generate_section(self, section_key: str, context: str, prompt: str) -> str:
+        """Return one section's text, from the response cache when enabled, else from Bedrock."""
+        cache_path = self._section_cache_path(section_key, context, prompt)
+        if cache_path is not None:
+            try:
+                text = cache_path.read_text(encoding='utf-8')
+                logger.info(f"♻️ Using cached {section_key} response")
+                return text
+            except OSError:
+                pass
+
+        model_id = self._section_model_id(section_key)
+        try:
+            text = json_loads(self._invoke_single(section_key, context, prompt, model_id))["text"]
         except Exception as e:
-            logger.error(f"❌ Bedrock generation failed: {e}")
-            logger.info("📋 Using high-quality fallback content...")
-            return self._generate_fallback_content(processed_data)
+            if model_id == self.model_id:
+                raise
+            # Fast model unavailable (not enabled, throttled, malformed output): retry on the default model
+            logger.warning(f"⚠️ Fast model failed for {section_key} ({e}); retrying with default model")
+            text = json_loads(self._invoke_single(section_key, context, prompt, self.model_id))["text"]
+        if cache_path is not None:
+            # Only successfully parsed sections are stored, never errors or fallback text
+            self._store_cached_section(cache_path, text)
+        return text
+
+    def _section_max_tokens(self, section_key: str) -> int:
+        """Completion budget for one section request."""
+        return min(_SECTION_MAX_TOKENS.get(section_key, self.max_tokens), self.max_tokens)
+
+    def _section_model_id(self, section_key: str) -> str:
+        """Model for one section request: the fast model for routine sections, else the default."""
+        return self.fast_model_id if section_key in _FAST_MODEL_SECTIONS else self.model_id
+
+    def _invoke_single(self, section_key: str, context: str, prompt: str, model_id: str) -> str:
+        """Stream one Bedrock completion for a section and return its submit_section tool input (JSON text)."""
+        body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": self._section_max_tokens(section_key),
+            # Cache breakpoint after tool + context: the section requests of one report (and
+            # retries or re-runs within the cache TTL) share this prefix, so later requests
+            # read it from Bedrock's prompt cache instead of processing it again
+            "system": [{"type": "text", "text": context, "cache_control": {"type": "ephemeral"}}],
+            "messages": [{"role": "user", "content": prompt}],
+            "tools": [_SECTION_TOOL],
+            "tool_choice": _TOOL_CHOICE,
+            "temperature": _TEMPERATURE
+        }
+
+        stream = self.bedrock_runtime.invoke_model_with_response_stream(
+            modelId=model_id,
+            body=json_dumps(body)
+        )
+
+        # Append into one growing buffer; the text is materialized once, at getvalue()
+        assembled = io.StringIO()
+        fragments = 0
+        event_stream = stream.get("body")
+        for event in event_stream:
+            chunk = event.get("chunk")
+            if not chunk:
+                continue
+            # Parse the raw event bytes directly; no intermediate decoded str
+            payload = json_loads(chunk.get("bytes"))
+            if payload.get("type") != "content_block_delta":
+                continue
+            delta = payload.get("delta") or EMPTY
+            if delta.get("type") != "input_json_delta":
+                continue
+
+            piece = delta.get("partial_json")
+            if piece:
+                assembled.write(piece)
+                fragments += 1
+                if fragments % 20 == 0:
+                    preview = piece.replace('\n', ' ')[:120]
+                    logger.info(f"📝 Stream fragment: {preview}")
+
+        return assembled.getvalue()
+
+    def _section_cache_path(self, section_key: str, context: str, prompt: str) -> Optional[Path]:
+        """Cache file for one section request, or None when caching is off.
+
+        Keyed on everything that shapes the response (model, token budget, temperature,
+        section and the full context and prompt), so any change to the inputs is a miss.
+        """
+        if self.cache_dir is None:
+            return None
+        key = hashlib.blake2b(
+            f"{self._section_model_id(section_key)}\0{self._section_max_tokens(section_key)}\0{_TEMPERATURE}\0{section_key}\0{context}\0{prompt}".encode('utf-8'),
+            digest_size=32
+        ).hexdigest()
+        return self.cache_dir / key[:2] / key
 
     @staticmethod
-    def _parse_json_response(text: str) -> Dict[str, Any]:
-        """Strip code fences and parse JSON."""
-        if not text:
-            raise ValueError("Empty response content from Bedrock")
-        cleaned = re.sub(r'```json\s*', '', text)
-        cleaned = re.sub(r'```\s*', '', cleaned)
-        cleaned = cleaned.strip()
-        return json.loads(cleaned)
+    def _store_cached_section(cache_path: Path, text: str) -> None:
+        """Best-effort write of a section response; a cache failure never fails the report.
+
+        Written to a private temp file and renamed into place, so a concurrent reader (another
+        section thread or report process) never sees a partial entry and no lock is needed.
+        """
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=f".{cache_path.name}.")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not write response cache: {e}")
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
 
     # ---------- Fallback Content ----------
 
     def _generate_fallback_content(self, processed_data: Dict[str, Any]) -> Dict[str, str]:
         """High-quality fallback technical content (concise but credible)."""
-        company_name = processed_data.get('company_name', 'Customer')
-        industry = processed_data.get('industry', 'Technology')
-
-        return {
-            "current_state_assessment": f"""CURRENT STATE ASSESSMENT
-
-            {company_name} operates a mixed estate typical of {industry} workloads with legacy monoliths, point-to-point integrations,
-            and limited automation. Baseline SLOs are inconsistent across tiers, and capacity headroom is constrained during peak windows.
-            Observability coverage exists but lacks uniform correlation across logs/metrics/traces; incident triage is manual and reactive.
-            Identity is centrally managed but privileges are coarse-grained, and secret rotation is inconsistent across services.""",
-
-                        "target_architecture_design": """TARGET ARCHITECTURE DESIGN
-
-            Recommended blueprint: multi-AZ VPC, private subnets, ALB fronting ECS/Fargate services, Aurora PostgreSQL with read replicas,
-            S3 data lake (prefix+partition design), ElastiCache (Redis) for hot paths, and Bedrock for GenAI workloads. CI/CD via Terraform,
-            pipelines with policy-as-code and environment promotions; WAF/Shield at the edge; centralized KMS keys and CloudTrail/Lake
-            for audit. DR uses cross-AZ plus periodic cross-Region backups with documented RTO/RPO.""",
-
-                        "data_strategy": """DATA STRATEGY
-
-            Ingest via event streams and batch pipelines; schema control with Glue Catalog and Lake Formation. Data classification
-            (Restricted/Confidential/Internal/Public) governs RBAC/ABAC policies. Storage tiering uses S3 Standard → IA → Glacier with
-            lifecycle transitions. Encryption everywhere with KMS; tokenization for sensitive fields; metadata capture for lineage; RAG
-            retrieval patterns with curated embeddings and vector index separation by tenancy.""",
-
-                        "model_evaluation_recommendations": """MODEL EVALUATION RECOMMENDATIONS
-
-            Adopt offline golden sets and online A/B with guardrails. Track hallucination/toxicity, latency, cost, and success metrics with
-            SLIs/SLOs. Introduce HITL review queues for high-risk classes and regression gates in CI. Cache strategies reduce cost/latency;
-            error isolation via circuit breakers and fallback responders. Clear acceptance criteria and rollback signals are codified.""",
-
-                        "implementation_plan": """IMPLEMENTATION PLAN
-
-            Phase 1 (1–2): Foundations & baselining; envs, IaC, observability, security controls. Phase 2 (3–5): Core build (APIs, data
-            pipelines, guardrails). Phase 3 (6–7): Testing (load, security, UAT, perf tuning). Phase 4 (8): Deployment (blue/green,
-            rollback, DR test). Phase 5 (9–10): Stabilization, SRE playbooks, KT/handover. RACI with dependency mapping and risks/mitigations.""",
-
-                        "integration_and_operations": """INTEGRATION AND OPERATIONS
-
-            Contracts specify authZ scopes, idempotency, and backoff. Observability: CloudWatch/X-Ray + custom metrics, unified
-            dashboards, actionable alerts. Day-2 ops includes patching cadence, incident runbooks, change controls, DR drills,
-            backup/restore tests, cost budgets with anomaly detection, and continuous compliance evidence capture."""
+        fields = {
+            'company_name': processed_data.get('company_name', 'Customer'),
+            'industry': processed_data.get('industry', 'Technology'),
         }
+        return {key: template.format_map(fields) for key, template in _FALLBACK_TEMPLATES.items()}
 
     # ---------- PDF Build (same layout primitives as compliance) ----------
 
     def create_title_page(self, styles, customer_data):
         """Create technical report title page (matching compliance report sophistication)"""
+        from reportlab.platypus import Paragraph, Spacer, PageBreak, Table
+        from reportlab.lib.units import inch
+        from src.report_styles import create_title_table_style
+
         elements = []
         
         # Add space at top
@@ -353,22 +518,13 @@ class Cloud202TechnicalDeepDiveGenerator:
         details_data = [
             ['Industry:', customer_data.get('industry', 'Technology')],
             ['Assessment Type:', 'Technical Implementation'],
-            ['Assessment Date:', customer_data.get('assessment_date', datetime.now().strftime('%Y-%m-%d'))],
+            ['Assessment Date:', customer_data.get('assessment_date', self.report_date_iso)],
             ['Current State:', customer_data.get('current_state', 'Assessment Required')],
             ['Tech Stack:', customer_data.get('tech_stack', 'Mixed Environment')]
         ]
         
         details_table = Table(details_data, colWidths=[2.2*inch, 2.8*inch])
-        details_table.setStyle(TableStyle([
-            ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 11),
-            ('FONT', (1, 0), (1, -1), 'Helvetica', 11),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#2c5282')),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.white, colors.HexColor('#F8FAFB')]),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-            ('LINEBELOW', (0, 0), (-1, -1), 0.5, colors.HexColor('#E0E0E0')),
-        ]))
+        details_table.setStyle(create_title_table_style())
         elements.append(details_table)
         
         elements.append(Spacer(1, 0.6 * inch))
@@ -412,53 +568,60 @@ class Cloud202TechnicalDeepDiveGenerator:
 
     def create_content_section(self, title: str, content: str, styles):
         """Create content section (matching compliance report intelligence)"""
-        elements = []
-        
+        from reportlab.platypus import Paragraph, Spacer, PageBreak
+        from reportlab.lib.units import inch
+
         # Section title
-        section_title = Paragraph(title, styles['MainHeading'])
-        elements.append(section_title)
-        elements.append(Spacer(1, 0.2 * inch))
+        elements = [Paragraph(title, styles['MainHeading']), Spacer(1, 0.2 * inch)]
         
-        # Process content
+        # Process content: one extend per section instead of two appends per paragraph
         if content.strip():
-            # Split into paragraphs
-            paragraphs = content.split('\n\n')
-            
-            for para in paragraphs:
-                para = para.strip()
-                if not para:
-                    continue
-                
-                # Skip if paragraph matches section title (avoid duplicate)
-                if para == title:
-                    continue
-                
-                # Check if it's a subsection header
-                is_subsection = para.endswith(':') or (
-                    len(para.split()) <= 8 and para[0].isupper() and len(para) < 80
-                )
-                
-                if is_subsection:
-                    # Subsection heading
-                    subsection = Paragraph(para, styles['SectionHeading'])
-                    elements.append(subsection)
-                    elements.append(Spacer(1, 0.08 * inch))
-                else:
-                    # Regular paragraph
-                    paragraph = Paragraph(para, styles['BodyTextEnhanced'])
-                    elements.append(paragraph)
-                    elements.append(Spacer(1, 0.1 * inch))
+            elements.extend(self._paragraph_flowables(title, content, styles))
         
         # Always end with page break for dedicated pages
-        if elements and len(elements) > 2:
+        if len(elements) > 2:
             elements.append(PageBreak())
         
         return elements
 
-    def build_pdf(self, content: Dict[str, str], output_path: Path) -> None:
-        """Render the Technical report into a styled PDF (matching compliance sophistication)."""
-        processed_data = self.process_assessment_data({'responses': {}}) if not hasattr(self, '_current_processed_data') else self._current_processed_data
-        
+    @staticmethod
+    def _paragraph_flowables(title: str, content: str, styles):
+        """Yield (Paragraph, Spacer) flowables for each paragraph of a section body."""
+        from reportlab.platypus import Paragraph, Spacer
+        from reportlab.lib.units import inch
+
+        heading_style = styles['SectionHeading']
+        body_style = styles['BodyTextEnhanced']
+        # Paragraphs stay separate flowables so platypus can break pages between them, and
+        # Spacers are created per paragraph: a shared instance is not safe to place twice
+        for para in content.split('\n\n'):
+            para = para.strip()
+            # Skip blanks and paragraphs matching the section title (avoid duplicate)
+            if not para or para == title:
+                continue
+            
+            # Check if it's a subsection header
+            if is_subsection(para):
+                yield Paragraph(para, heading_style)
+                yield Spacer(1, 0.08 * inch)
+            else:
+                yield Paragraph(para, body_style)
+                yield Spacer(1, 0.1 * inch)
+
+    def build_pdf(self, content: Dict[str, str], output_path: Path, processed_data: Dict[str, Any],
+                  section_flowables: Optional[Dict[str, list]] = None) -> None:
+        """Render the Technical report into a styled PDF (matching compliance sophistication).
+
+        section_flowables holds sections already laid out by key (see generate_report);
+        any section missing from it is built here from content. The output directory is
+        created if missing.
+        """
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import SimpleDocTemplate
+        from reportlab.lib.units import inch
+        from src.report_styles import EnhancedNumberedCanvas
+
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         doc = SimpleDocTemplate(
             str(output_path),
             pagesize=A4,
@@ -470,24 +633,19 @@ class Cloud202TechnicalDeepDiveGenerator:
             author="Cloud202 Technical Team"
         )
         
-        styles = create_enhanced_styles()
-        elements = []
-        
-        # Sophisticated title page
-        elements.extend(self.create_title_page(styles, processed_data))
-        
-        # Content sections using sophisticated formatting
-        sections = [
-            ("Current State Assessment", content.get('current_state_assessment', '')),
-            ("Target Architecture Design", content.get('target_architecture_design', '')),
-            ("Data Strategy", content.get('data_strategy', '')),
-            ("Model Evaluation Recommendations", content.get('model_evaluation_recommendations', '')),
-            ("Implementation Plan", content.get('implementation_plan', '')),
-            ("Integration & Operations", content.get('integration_and_operations', ''))
-        ]
+        styles = self.styles
+        prebuilt = section_flowables or {}
         
-        for title, text in sections:
-            elements.extend(self.create_content_section(title, text, styles))
+        # Assemble the story in a single pass: title page followed by each section's flowables,
+        # using the prebuilt layout where a section already has one
+        sections = (
+            prebuilt[key] if key in prebuilt else self.create_content_section(title, content.get(key, ''), styles)
+            for title, key in _SECTIONS
+        )
+        elements = list(chain(
+            self.create_title_page(styles, processed_data),
+            chain.from_iterable(sections)
+        ))
         
         # Build PDF with EnhancedNumberedCanvas
         def make_canvas(*args, **kwargs):
@@ -508,14 +666,20 @@ class Cloud202TechnicalDeepDiveGenerator:
         """End-to-end: load → process → generate → render PDF."""
         raw = self.load_assessment_data(json_file_path)
         processed = self.process_assessment_data(raw)
-        content = self.generate_report_content(processed)
 
-        # Store processed data for PDF generation
-        self._current_processed_data = processed
+        # Parse each section into flowables as soon as it arrives, overlapping that work with
+        # the sections still streaming; only page layout (doc.build) waits for all of them
+        headings = {key: title for title, key in _SECTIONS}
+        section_flowables: Dict[str, list] = {}
+
+        def layout_section(key: str, text: str) -> None:
+            section_flowables[key] = self.create_content_section(headings[key], text, self.styles)
 
-        safe_company = re.sub(r'[^A-Za-z0-9_-]+', '_', processed.get('company_name', 'Customer')).strip('_')
+        content = self.generate_report_content(processed, on_section=layout_section)
+
+        safe_company = SAFE_NAME_RE.sub('_', processed.get('company_name', 'Customer')).strip('_')
         pdf_path = self.output_dir / f"Technical_Report_{safe_company}_{self.timestamp}.pdf"
-        self.build_pdf(content, pdf_path)
+        self.build_pdf(content, pdf_path, processed, section_flowables)
 
         return {
             "pdf_path": str(pdf_path),
@@ -530,9 +694,15 @@ def main():
     parser = argparse.ArgumentParser(description="Generate Technical Deep-Dive Report (compliance-style runtime).")
     parser.add_argument("input_json", help="Path to assessment JSON export")
     parser.add_argument("--region", help="AWS region (overrides BedrockConfig default for technical)", default=None)
+    parser.add_argument("--cache-dir", help="Reuse Bedrock section responses for identical requests from this directory (or set BEDROCK_CACHE=1)", default=None)
     args = parser.parse_args()
 
-    gen = Cloud202TechnicalDeepDiveGenerator(aws_region=args.region)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(filename)s - %(levelname)s - %(message)s'
+    )
+
+    gen = Cloud202TechnicalDeepDiveGenerator(aws_region=args.region, cache_dir=args.cache_dir)
     result = gen.generate_report(args.input_json)
 
     print(json.dumps({
@@ -13,10 +13,10 @@ def test_all_reports():
     print("=" * 70)
     
     try:
-        from src.report_labs_executive import Cloud202ExecutiveReportGenerator
+        from src.report_labs_executive import generate_all_reports
         
         print("\n📝 Generating all reports using test_json_comprehensive.json...")
-        results = Cloud202ExecutiveReportGenerator.generate_all_reports(
+        results = generate_all_reports(
             'test_json_comprehensive.json', 
             force_compliance=True
         )
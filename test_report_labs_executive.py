@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for the report orchestrator's pool selection in generate_all_reports
+Run from the project root: python -m unittest test_report_labs_executive
+"""
+
+import threading
+import unittest
+from unittest import mock
+
+from src import report_labs_executive
+
+
+class ThreadFallbackTest(unittest.TestCase):
+
+    def test_process_pool_oserror_falls_back_to_threads(self):
+        calls = []
+        lock = threading.Lock()
+
+        def fake_generate_one(rtype, json_file_path, force_compliance):
+            with lock:
+                calls.append((rtype, threading.current_thread() is threading.main_thread()))
+            return {"pdf_path": f"reports/{rtype}.pdf"}
+
+        with mock.patch.object(report_labs_executive, "ProcessPoolExecutor",
+                               side_effect=OSError("no /dev/shm")), \
+                mock.patch.object(report_labs_executive, "_generate_one", side_effect=fake_generate_one):
+            results = report_labs_executive.generate_all_reports("assessment.json")
+
+        self.assertEqual(
+            results,
+            {rtype: {"pdf_path": f"reports/{rtype}.pdf"} for rtype in ("executive", "technical", "compliance")},
+        )
+        self.assertEqual(sorted(rtype for rtype, _ in calls), ["compliance", "executive", "technical"])
+        # Built on pool threads, not serially on the caller's thread
+        self.assertFalse(any(on_main for _, on_main in calls))
+
+    def test_failed_report_is_none_on_thread_fallback(self):
+        def fake_generate_one(rtype, json_file_path, force_compliance):
+            if rtype == "technical":
+                raise RuntimeError("boom")
+            return {"pdf_path": f"reports/{rtype}.pdf"}
+
+        with mock.patch.object(report_labs_executive, "ProcessPoolExecutor",
+                               side_effect=OSError("no /dev/shm")), \
+                mock.patch.object(report_labs_executive, "_generate_one", side_effect=fake_generate_one):
+            results = report_labs_executive.generate_all_reports("assessment.json")
+
+        self.assertIsNone(results["technical"])
+        self.assertEqual(results["executive"], {"pdf_path": "reports/executive.pdf"})
+        self.assertEqual(results["compliance"], {"pdf_path": "reports/compliance.pdf"})
+
+
+if __name__ == "__main__":
+    unittest.main()
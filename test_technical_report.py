@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for the Technical report's per-section Bedrock generation, using a mocked Bedrock client
+Run from the project root: python -m unittest test_technical_report
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from src.technical_report import (
+    Cloud202TechnicalDeepDiveGenerator, _FAST_MODEL_SECTIONS, _SECTION_SPECS, _SECTIONS,
+)
+
+SECTION_KEYS = [key for _, key in _SECTIONS]
+
+PROCESSED = {
+    'company_name': 'Test Co',
+    'industry': 'Financial Technology',
+    'assessment_date': '2025-01-01',
+    'responses': {'business-problems': 'Payment reconciliation is slow.'},
+}
+
+
+class FakeBedrockClient:
+    """Streams a submit_section tool call whose text names the section (matched by its spec) and model."""
+
+    def __init__(self, fail_models=(), delays=None):
+        self.fail_models = set(fail_models)
+        self.delays = delays or {}
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def invoke_model_with_response_stream(self, modelId, body):
+        request = json.loads(body)
+        prompt = request['messages'][0]['content']
+        key = next(k for k, spec in _SECTION_SPECS if spec in prompt)
+        with self._lock:
+            self.calls.append((key, modelId))
+        if modelId in self.fail_models:
+            raise RuntimeError(f"AccessDeniedException for {modelId}")
+        time.sleep(self.delays.get(key, 0))
+
+        tool_input = json.dumps({"text": f"{key} from {modelId}"})
+        events = [{"type": "message_start"}, {"type": "content_block_start"}]
+        events += [
+            {"type": "content_block_delta", "delta": {"type": "input_json_delta", "partial_json": tool_input[i:i + 7]}}
+            for i in range(0, len(tool_input), 7)
+        ]
+        events += [{"type": "content_block_stop"}, {"type": "message_stop"}]
+        return {"body": ({"chunk": {"bytes": json.dumps(e).encode()}} for e in events)}
+
+
+def make_generator(client, cache_dir=None):
+    generator = Cloud202TechnicalDeepDiveGenerator(aws_region="eu-west-2", cache_dir=cache_dir)
+    generator.bedrock_runtime = client
+    return generator
+
+
+class SectionAssemblyTest(unittest.TestCase):
+
+    def test_sections_follow_report_order_regardless_of_completion_order(self):
+        # Earlier sections finish last, so as_completed yields them in reverse
+        delays = {key: 0.02 * (len(SECTION_KEYS) - i) for i, key in enumerate(SECTION_KEYS)}
+        client = FakeBedrockClient(delays=delays)
+        generator = make_generator(client)
+        arrived = []
+
+        content = generator.generate_report_content(PROCESSED, on_section=lambda key, text: arrived.append(key))
+
+        self.assertEqual(list(content), SECTION_KEYS)
+        self.assertEqual(sorted(arrived), sorted(SECTION_KEYS))
+        self.assertNotEqual(arrived, SECTION_KEYS)
+        for key in SECTION_KEYS:
+            self.assertTrue(content[key].startswith(key))
+
+    def test_sections_route_to_fast_or_default_model(self):
+        client = FakeBedrockClient()
+        generator = make_generator(client)
+
+        generator.generate_report_content(PROCESSED)
+
+        models = dict(client.calls)
+        for key in SECTION_KEYS:
+            expected = generator.fast_model_id if key in _FAST_MODEL_SECTIONS else generator.model_id
+            self.assertEqual(models[key], expected)
+
+
+class FastModelFallbackTest(unittest.TestCase):
+
+    def test_fast_model_failure_retries_on_default_model(self):
+        generator = make_generator(None)
+        client = FakeBedrockClient(fail_models={generator.fast_model_id})
+        generator.bedrock_runtime = client
+
+        content = generator.generate_report_content(PROCESSED)
+
+        for key in _FAST_MODEL_SECTIONS:
+            self.assertEqual(content[key], f"{key} from {generator.model_id}")
+            self.assertEqual([model for k, model in client.calls if k == key],
+                             [generator.fast_model_id, generator.model_id])
+        self.assertEqual(len(client.calls), len(SECTION_KEYS) + len(_FAST_MODEL_SECTIONS))
+
+    def test_default_model_failure_falls_back_to_template(self):
+        generator = make_generator(None)
+        client = FakeBedrockClient(fail_models={generator.model_id})
+        generator.bedrock_runtime = client
+
+        content = generator.generate_report_content(PROCESSED)
+        fallback = generator._generate_fallback_content(PROCESSED)
+
+        self.assertEqual(list(content), SECTION_KEYS)
+        for key in SECTION_KEYS:
+            if key in _FAST_MODEL_SECTIONS:
+                self.assertEqual(content[key], f"{key} from {generator.fast_model_id}")
+            else:
+                self.assertEqual(content[key], fallback[key])
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _cache_files(self):
+        return sorted(
+            os.path.join(root, name)
+            for root, _dirs, names in os.walk(self.cache_dir)
+            for name in names
+        )
+
+    def test_miss_then_hit_round_trip(self):
+        first_client = FakeBedrockClient()
+        first = make_generator(first_client, cache_dir=self.cache_dir).generate_report_content(PROCESSED)
+        self.assertEqual(len(first_client.calls), len(SECTION_KEYS))
+
+        files = self._cache_files()
+        self.assertEqual(len(files), len(SECTION_KEYS))
+        for path in files:
+            name = os.path.basename(path)
+            # Entries are renamed into place; no mkstemp temp files are left behind
+            self.assertFalse(name.startswith('.'))
+            self.assertEqual(os.path.basename(os.path.dirname(path)), name[:2])
+
+        second_client = FakeBedrockClient()
+        second = make_generator(second_client, cache_dir=self.cache_dir).generate_report_content(PROCESSED)
+        self.assertEqual(second_client.calls, [])
+        self.assertEqual(second, first)
+
+    def test_changed_prompt_is_a_miss(self):
+        make_generator(FakeBedrockClient(), cache_dir=self.cache_dir).generate_report_content(PROCESSED)
+
+        client = FakeBedrockClient()
+        changed = dict(PROCESSED, company_name='Other Co')
+        make_generator(client, cache_dir=self.cache_dir).generate_report_content(changed)
+
+        self.assertEqual(len(client.calls), len(SECTION_KEYS))
+        self.assertEqual(len(self._cache_files()), 2 * len(SECTION_KEYS))
+
+    def test_failed_write_leaves_no_partial_entry(self):
+        generator = make_generator(FakeBedrockClient(), cache_dir=self.cache_dir)
+        cache_path = generator._section_cache_path('data_strategy', 'context', 'prompt')
+        with mock.patch("src.technical_report.os.replace", side_effect=OSError("disk full")):
+            generator._store_cached_section(cache_path, "text")
+
+        self.assertFalse(cache_path.exists())
+        self.assertEqual(self._cache_files(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()